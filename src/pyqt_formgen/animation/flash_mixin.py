@@ -1415,6 +1415,27 @@ class _GlobalFlashCoordinator:
             self._timer and self._timer.isActive()):
             self._timer.stop()
 
+    def on_window_state_changed(self, overlay: QWidget) -> None:
+        """Repaint an overlay once when its window is restored.
+
+        The tick skips minimized windows, so flashes that expired meanwhile
+        left the last frame on screen; the shared timer keeps running for
+        the other windows either way.
+        """
+        if self._is_overlay_paintable(overlay):
+            try:
+                overlay.update()
+            except RuntimeError:
+                pass  # Widget deleted
+
+    @staticmethod
+    def _is_overlay_paintable(overlay: QWidget) -> bool:
+        """True if the overlay's window is visible and not minimized."""
+        try:
+            return overlay._window.isVisible() and not overlay._window.isMinimized()
+        except RuntimeError:
+            return False  # Window deleted
+
     def get_computed_color(self, key: str) -> Optional[QColor]:
         """Get pre-computed color for key. O(1) dict lookup."""
         return self._computed_colors.get(key)
@@ -1465,23 +1486,16 @@ class _GlobalFlashCoordinator:
         if expired_keys:
             expired_keys_set = set(expired_keys)
             for window_id, overlay in WindowFlashOverlay._overlays.items():
-                # PERFORMANCE FIX: Skip hidden windows in clear detection too
-                try:
-                    if not overlay._window.isVisible():
-                        continue
-                except RuntimeError:
-                    continue  # Window deleted
+                # PERFORMANCE FIX: Skip hidden/minimized windows in clear detection too
+                if not self._is_overlay_paintable(overlay):
+                    continue
 
                 if expired_keys_set & overlay._elements.keys():
                     windows_needing_clear.add(window_id)
 
         for window_id, overlay in WindowFlashOverlay._overlays.items():
-            # PERFORMANCE FIX: Skip hidden windows (don't waste CPU painting invisible windows)
-            try:
-                if not overlay._window.isVisible():
-                    continue
-            except RuntimeError:
-                # Window deleted
+            # PERFORMANCE FIX: Skip hidden/minimized windows (don't waste CPU painting invisible windows)
+            if not self._is_overlay_paintable(overlay):
                 continue
 
             # Find which of this overlay's registered elements are currently flashing
@@ -1529,12 +1543,9 @@ class _GlobalFlashCoordinator:
             if window_id not in active_windows_this_frame:
                 overlay = WindowFlashOverlay._overlays.get(window_id)
                 if overlay:
-                    # PERFORMANCE FIX: Skip hidden windows
-                    try:
-                        if not overlay._window.isVisible():
-                            continue
-                    except RuntimeError:
-                        continue  # Window deleted
+                    # PERFORMANCE FIX: Skip hidden/minimized windows
+                    if not self._is_overlay_paintable(overlay):
+                        continue
 
                     try:
                         overlay.update()  # One final repaint to clear
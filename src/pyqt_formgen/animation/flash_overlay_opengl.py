@@ -14,8 +14,12 @@ with many more flash elements where instanced rendering may pay off.
 
 import logging
 import struct
-from typing import Dict, List, Optional, Set
-import numpy as np
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Fall back to struct packing (see _PACKER)
 
 try:
     from PyQt6.QtWidgets import QWidget, QMainWindow, QDialog, QApplication
@@ -29,7 +33,10 @@ except ImportError:
     OPENGL_AVAILABLE = False
     QOpenGLWidget = object  # Dummy for type checking
 
-from .flash_mixin import FlashElement, OverlayGeometryCache
+from .flash_mixin import FlashElement, OverlayGeometryCache, _GlobalFlashCoordinator
+
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QColor
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +51,7 @@ class _SharedGLContextManager:
     - Driver initialization happens once at app startup (background)
     - All overlay widgets share this context (compiled shaders are cached)
     - New windows have zero GL initialization delay
+    - Linked program binary is stashed so later overlays skip GLSL compilation
     """
     _instance: Optional['_SharedGLContextManager'] = None
 
@@ -69,6 +77,7 @@ class _SharedGLContextManager:
         self._shared_context: Optional[QOpenGLContext] = None
         self._offscreen_surface: Optional[QOffscreenSurface] = None
         self._format: Optional[QSurfaceFormat] = None
+        self._program_binary: Optional[Tuple[int, bytes]] = None  # (format, blob)
 
     def _initialize(self):
         """Create shared context and compile shaders."""
@@ -96,7 +105,10 @@ class _SharedGLContextManager:
 
         # Make current and do initial GL setup (warms up driver)
         if self._shared_context.makeCurrent(self._offscreen_surface):
-            # Just making current warms up the driver
+            # Compile once here so overlays can load the linked binary
+            program = _compile_program_from_source(None)
+            if program is not None:
+                self.store_program_binary(program.programId())
             self._shared_context.doneCurrent()
             logger.info("[OpenGL] Shared context pre-warmed successfully")
         else:
@@ -114,6 +126,36 @@ class _SharedGLContextManager:
             self._initialize()
         return self._format
 
+    def get_program_binary(self) -> Optional[Tuple[int, bytes]]:
+        """Get the cached (format, blob) program binary, if any."""
+        return self._program_binary
+
+    def store_program_binary(self, program_id: int) -> None:
+        """Read back a linked program's binary (requires a current context)."""
+        if self._program_binary is not None:
+            return
+        try:
+            if gl.glGetIntegerv(gl.GL_NUM_PROGRAM_BINARY_FORMATS) == 0:
+                return
+            size = int(gl.glGetProgramiv(program_id, gl.GL_PROGRAM_BINARY_LENGTH))
+            if size <= 0:
+                return
+            length = (gl.GLint * 1)()
+            binary_format = (gl.GLenum * 1)()
+            binary = (gl.ctypes.c_ubyte * size)()
+            gl.glGetProgramBinary(program_id, size, length, binary_format, binary)
+            self._program_binary = (int(binary_format[0]), bytes(binary)[:int(length[0])])
+            logger.debug(f"[OpenGL] Cached program binary ({int(length[0])} bytes)")
+        except Exception as e:
+            # ARB_get_program_binary is optional on 3.3 drivers
+            logger.debug(f"[OpenGL] Program binary unavailable: {e}")
+
+
+# One instance: x, y, w, h, r, g, b, a, radius (C-level packer, used without NumPy)
+_PACKER = struct.Struct("<9f")
+INSTANCE_STRIDE = _PACKER.size  # 36 bytes
+_QUAD_CORNERS = struct.pack("<8f", 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+
 
 def prewarm_opengl() -> None:
     """Pre-warm OpenGL at app startup. Call from main window init."""
@@ -132,10 +174,12 @@ layout(location = 2) in vec4 color;    // r, g, b, a
 layout(location = 3) in float radius;  // corner radius
 
 // Output to fragment shader
-out vec4 fragColor;
-out vec2 fragPos;     // Position within rectangle (0,0 to width,height)
-out vec2 fragSize;    // Rectangle size
-out float fragRadius; // Corner radius
+// Per-instance values are flat: constant across the quad, no interpolation cost
+flat out vec4 fragColor;
+out vec2 fragPos;           // Position within rectangle (0,0 to width,height)
+flat out vec2 fragSize;     // Rectangle size
+flat out float fragRadius;  // Corner radius
+flat out int fragIsRounded; // 0 = sharp rect (fast path), 1 = rounded SDF
 
 uniform mat4 projection;  // Window coords → normalized device coords
 
@@ -149,26 +193,61 @@ void main() {
     fragPos = corner * rect.zw;
     fragSize = rect.zw;
     fragRadius = radius;
+    fragIsRounded = radius >= 0.5 ? 1 : 0;
 }
 """
 
 # Fragment shader: Draw rounded rectangle with anti-aliasing
+# Common cases avoid the sqrt in length():
+# - Sharp rects (tree/list items) skip the SDF entirely
+# - Interior and straight-edge fragments use the axis-aligned distance
+# - Corner fragments compare squared distance against the AA band first
 FRAGMENT_SHADER = """
 #version 330 core
 
-in vec4 fragColor;
+flat in vec4 fragColor;
 in vec2 fragPos;
-in vec2 fragSize;
-in float fragRadius;
+flat in vec2 fragSize;
+flat in float fragRadius;
+flat in int fragIsRounded;
 
 out vec4 outputColor;
 
 void main() {
+    if (fragIsRounded == 0) {
+        outputColor = fragColor;
+        return;
+    }
+
     // Signed distance field for rounded rectangle
     // https://iquilezles.org/articles/distfunctions2d/
     vec2 center = fragSize * 0.5;
     vec2 d = abs(fragPos - center) - (center - fragRadius);
-    float dist = length(max(d, 0.0)) + min(max(d.x, d.y), 0.0) - fragRadius;
+
+    // Interior: fully covered, no AA needed
+    if (max(d.x, d.y) <= 0.0) {
+        outputColor = fragColor;
+        return;
+    }
+
+    float dist;
+    if (d.x <= 0.0 || d.y <= 0.0) {
+        // Straight edge band: distance is axis-aligned
+        dist = max(d.x, d.y) - fragRadius;
+    } else {
+        // Corner: squared distance decides fully-in / fully-out without sqrt
+        float d2 = dot(d, d);
+        float inner = max(fragRadius - 0.5, 0.0);
+        float outer = fragRadius + 0.5;
+        if (d2 <= inner * inner) {
+            outputColor = fragColor;
+            return;
+        }
+        if (d2 >= outer * outer) {
+            discard;
+        }
+        dist = sqrt(d2) - fragRadius;
+    }
 
     // Anti-aliased edge (sub-pixel precision)
     float alpha = 1.0 - smoothstep(-0.5, 0.5, dist);
@@ -178,6 +257,43 @@ void main() {
 """
 
 
+def _compile_program_from_source(parent) -> Optional['QOpenGLShaderProgram']:
+    """Compile and link the overlay program from GLSL source."""
+    program = QOpenGLShaderProgram(parent)
+
+    if not program.addShaderFromSourceCode(QOpenGLShader.ShaderTypeBit.Vertex, VERTEX_SHADER):
+        logger.error(f"[OpenGL] Vertex shader compile failed: {program.log()}")
+        return None
+
+    if not program.addShaderFromSourceCode(QOpenGLShader.ShaderTypeBit.Fragment, FRAGMENT_SHADER):
+        logger.error(f"[OpenGL] Fragment shader compile failed: {program.log()}")
+        return None
+
+    if not program.link():
+        logger.error(f"[OpenGL] Shader link failed: {program.log()}")
+        return None
+
+    return program
+
+
+def _load_program_from_binary(parent, program_binary: Tuple[int, bytes]) -> Optional['QOpenGLShaderProgram']:
+    """Create the overlay program from a cached binary, or None if the driver rejects it."""
+    binary_format, blob = program_binary
+    program = QOpenGLShaderProgram(parent)
+    try:
+        if not program.create():
+            return None
+        gl.glProgramBinary(program.programId(), binary_format, blob, len(blob))
+        # With no attached shaders, link() just adopts the GL_LINK_STATUS of the binary
+        if not program.link():
+            logger.debug(f"[OpenGL] Cached program binary rejected: {program.log()}")
+            return None
+    except Exception as e:
+        logger.debug(f"[OpenGL] Program binary load failed: {e}")
+        return None
+    return program
+
+
 class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
     """GPU-accelerated flash overlay using OpenGL.
 
@@ -250,6 +366,14 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
         self._elements: Dict[str, List[FlashElement]] = {}
         self._cache = OverlayGeometryCache()
 
+        # Flat geometry derived from _elements in _rebuild_geometry_cache (SoA layout):
+        # one row per drawable element, rows grouped by key
+        # (NumPy arrays when available, plain lists otherwise)
+        self._row_geom = []  # x, y, w, h, radius
+        self._row_key_idx = []  # row -> index into _key_index
+        self._key_index: Dict[str, int] = {}  # key -> key row in per-frame color table
+        self._key_rows: Dict[str, Tuple[int, int]] = {}  # key -> [start, stop) row range
+
         # OpenGL resources (created in initializeGL)
         self._shader_program: Optional[QOpenGLShaderProgram] = None
         self._vao: Optional[QOpenGLVertexArrayObject] = None
@@ -259,7 +383,10 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
 
         # Pre-allocated buffer for instance data (avoids per-frame allocation)
         self._max_instances = 256  # Max rectangles per frame
-        self._instance_array = np.zeros(self._max_instances * 9, dtype=np.float32)
+        if np is not None:
+            self._instance_array = np.zeros(self._max_instances * 9, dtype=np.float32)
+        else:
+            self._instance_array = bytearray(self._max_instances * INSTANCE_STRIDE)
         self._instance_buffer_size = 0  # Current allocated GPU buffer size
 
         # Make overlay transparent and pass mouse events through
@@ -287,26 +414,23 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
         """Initialize OpenGL resources (called once on first show)."""
         logger.info("[OpenGL] Initializing flash overlay shaders")
 
-        # Create shader program
-        self._shader_program = QOpenGLShaderProgram(self)
-
-        if not self._shader_program.addShaderFromSourceCode(
-            QOpenGLShader.ShaderTypeBit.Vertex, VERTEX_SHADER
-        ):
-            logger.error(f"[OpenGL] Vertex shader compile failed: {self._shader_program.log()}")
-            return
-
-        if not self._shader_program.addShaderFromSourceCode(
-            QOpenGLShader.ShaderTypeBit.Fragment, FRAGMENT_SHADER
-        ):
-            logger.error(f"[OpenGL] Fragment shader compile failed: {self._shader_program.log()}")
-            return
-
-        if not self._shader_program.link():
-            logger.error(f"[OpenGL] Shader link failed: {self._shader_program.log()}")
-            return
-
-        logger.info("[OpenGL] Shaders compiled successfully")
+        # Create shader program: reuse cached binary, fall back to source compile
+        mgr = _SharedGLContextManager.get()
+        program_binary = mgr.get_program_binary()
+        program = None
+        if program_binary is not None:
+            program = _load_program_from_binary(self, program_binary)
+            if program is not None:
+                logger.info("[OpenGL] Shaders loaded from cached program binary")
+
+        if program is None:
+            program = _compile_program_from_source(self)
+            if program is None:
+                return
+            mgr.store_program_binary(program.programId())
+            logger.info("[OpenGL] Shaders compiled successfully")
+
+        self._shader_program = program
 
         # Create VAO
         self._vao = QOpenGLVertexArrayObject(self)
@@ -314,17 +438,10 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
         self._vao.bind()
 
         # Create quad VBO (corners: 0,0  1,0  0,1  1,1)
-        quad_data = np.array([
-            0.0, 0.0,
-            1.0, 0.0,
-            0.0, 1.0,
-            1.0, 1.0
-        ], dtype=np.float32)
-
         self._quad_vbo = QOpenGLBuffer(QOpenGLBuffer.Type.VertexBuffer)
         self._quad_vbo.create()
         self._quad_vbo.bind()
-        self._quad_vbo.allocate(quad_data.tobytes(), quad_data.nbytes)
+        self._quad_vbo.allocate(_QUAD_CORNERS, len(_QUAD_CORNERS))
 
         # Setup vertex attribute (location 0: corner)
         self._shader_program.bind()
@@ -337,26 +454,23 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
         self._instance_vbo.bind()
         self._instance_vbo.setUsagePattern(QOpenGLBuffer.UsagePattern.DynamicDraw)
         # Pre-allocate with max capacity (9 floats per instance * 4 bytes * max_instances)
-        self._instance_buffer_size = self._max_instances * 9 * 4
+        self._instance_buffer_size = self._max_instances * INSTANCE_STRIDE
         self._instance_vbo.allocate(self._instance_buffer_size)
 
         # Setup instance attributes in VAO (done ONCE, not per frame!)
-        # Stride = 36 bytes (9 floats * 4 bytes)
-        stride = 36
-
         # Location 1: rect (vec4) - x, y, width, height
         self._shader_program.enableAttributeArray(1)
-        gl.glVertexAttribPointer(1, 4, gl.GL_FLOAT, gl.GL_FALSE, stride, None)
+        gl.glVertexAttribPointer(1, 4, gl.GL_FLOAT, gl.GL_FALSE, INSTANCE_STRIDE, None)
         gl.glVertexAttribDivisor(1, 1)  # One per instance
 
         # Location 2: color (vec4) - r, g, b, a (offset 16 bytes)
         self._shader_program.enableAttributeArray(2)
-        gl.glVertexAttribPointer(2, 4, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(16))
+        gl.glVertexAttribPointer(2, 4, gl.GL_FLOAT, gl.GL_FALSE, INSTANCE_STRIDE, gl.ctypes.c_void_p(16))
         gl.glVertexAttribDivisor(2, 1)
 
         # Location 3: radius (float) - corner radius (offset 32 bytes)
         self._shader_program.enableAttributeArray(3)
-        gl.glVertexAttribPointer(3, 1, gl.GL_FLOAT, gl.GL_FALSE, stride, gl.ctypes.c_void_p(32))
+        gl.glVertexAttribPointer(3, 1, gl.GL_FLOAT, gl.GL_FALSE, INSTANCE_STRIDE, gl.ctypes.c_void_p(32))
         gl.glVertexAttribDivisor(3, 1)
 
         self._instance_vbo.release()
@@ -388,10 +502,13 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
         if self._shader_program is None or self._vao is None or self._instance_vbo is None:
             return
 
+        # Nothing on screen to draw into (hidden, minimized, or transient zero size mid-resize)
+        if not self.isVisible() or self.width() == 0 or self.height() == 0 or self._window.isMinimized():
+            return
+
         gl.glClear(gl.GL_COLOR_BUFFER_BIT)
 
         # Get pre-computed colors from coordinator
-        from .flash_mixin import _GlobalFlashCoordinator
         coordinator = _GlobalFlashCoordinator.get()
         if not coordinator._computed_colors:
             return
@@ -401,55 +518,77 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
             clip_rects = self._get_scroll_area_clip_rects()
             self._rebuild_geometry_cache(clip_rects)
 
-        # Fill pre-allocated array directly (no Python list, no allocation)
-        idx = 0
-        for key, color in coordinator._computed_colors.items():
-            if key not in self._elements:
-                continue
-
-            cached_rects = self._cache.element_rects.get(key, [])
-            for rect_tuple in cached_rects:
-                if rect_tuple is None:
-                    continue
-                rect, radius = rect_tuple
-                if rect is None or not rect.isValid():
-                    continue
-
-                # Check capacity
-                if idx >= self._max_instances:
-                    break
-
-                # Pack directly into pre-allocated array
-                base = idx * 9
-                self._instance_array[base] = rect.x()
-                self._instance_array[base + 1] = rect.y()
-                self._instance_array[base + 2] = rect.width()
-                self._instance_array[base + 3] = rect.height()
-                self._instance_array[base + 4] = color.redF()
-                self._instance_array[base + 5] = color.greenF()
-                self._instance_array[base + 6] = color.blueF()
-                self._instance_array[base + 7] = color.alphaF()
-                self._instance_array[base + 8] = radius
-                idx += 1
-
+        if np is not None:
+            idx = self._pack_instances_numpy(coordinator._computed_colors)
+        else:
+            idx = self._pack_instances_struct(coordinator._computed_colors)
         if idx == 0:
             return
 
         num_instances = idx
-        data_size = num_instances * 9 * 4  # 9 floats × 4 bytes
+        data_size = num_instances * INSTANCE_STRIDE
 
         # Bind VAO (attribute pointers already set up in initializeGL)
         self._vao.bind()
         self._shader_program.bind()
         self._instance_vbo.bind()
 
-        # Upload instance data - numpy array is C-contiguous so this is fast
-        # glBufferSubData accepts numpy array directly via PyOpenGL
+        # Upload instance data - numpy array / bytearray are contiguous buffers,
+        # both accepted directly by PyOpenGL
         gl.glBufferSubData(gl.GL_ARRAY_BUFFER, 0, data_size, self._instance_array)
 
         # Draw ALL rectangles in ONE call
         gl.glDrawArraysInstanced(gl.GL_TRIANGLE_STRIP, 0, 4, num_instances)
 
+    def _pack_instances_numpy(self, computed_colors: Dict[str, 'QColor']) -> int:
+        """Gather animating rows into the instance array; returns instance count."""
+        # Per-key color table: only animating keys touch Python, rows are gathered vectorized
+        key_index = self._key_index
+        num_keys = len(key_index)
+        if num_keys == 0:
+            return 0
+        key_colors = np.zeros((num_keys, 4), dtype=np.float32)
+        key_active = np.zeros(num_keys, dtype=bool)
+        for key, color in computed_colors.items():
+            i = key_index.get(key)
+            if i is None:
+                continue
+            key_colors[i] = color.getRgbF()
+            key_active[i] = True
+
+        rows = np.flatnonzero(key_active[self._row_key_idx])[:self._max_instances]
+        idx = len(rows)
+        if idx == 0:
+            return 0
+
+        instances = self._instance_array.reshape(self._max_instances, 9)
+        geom = self._row_geom[rows]
+        instances[:idx, 0:4] = geom[:, 0:4]
+        instances[:idx, 4:8] = key_colors[self._row_key_idx[rows]]
+        instances[:idx, 8] = geom[:, 4]
+        return idx
+
+    def _pack_instances_struct(self, computed_colors: Dict[str, 'QColor']) -> int:
+        """NumPy-free packing via struct.pack_into; returns instance count."""
+        buf = self._instance_array
+        pack_into = _PACKER.pack_into
+        row_geom = self._row_geom
+        key_rows = self._key_rows
+        max_instances = self._max_instances
+        idx = 0
+        for key, color in computed_colors.items():
+            row_range = key_rows.get(key)
+            if row_range is None:
+                continue
+            r, g, b, a = color.getRgbF()
+            for row in range(row_range[0], row_range[1]):
+                if idx >= max_instances:
+                    return idx
+                x, y, w, h, radius = row_geom[row]
+                pack_into(buf, idx * INSTANCE_STRIDE, x, y, w, h, r, g, b, a, radius)
+                idx += 1
+        return idx
+
     # ==================== CACHE AND ELEMENT MANAGEMENT ====================
     # Same methods as WindowFlashOverlay
 
@@ -463,13 +602,16 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
             for i, existing in enumerate(self._elements[element.key]):
                 if existing.source_id == element.source_id:
                     self._elements[element.key][i] = element
+                    self._invalidate_geometry_cache()
                     return
 
         self._elements[element.key].append(element)
+        self._invalidate_geometry_cache()
 
     def unregister_element(self, key: str) -> None:
         """Unregister element."""
-        self._elements.pop(key, None)
+        if self._elements.pop(key, None) is not None:
+            self._invalidate_geometry_cache()
 
     def _install_scroll_event_filters(self):
         """Install event filters on scroll areas."""
@@ -487,6 +629,8 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
             self._invalidate_geometry_cache()
             if obj is self._window and event.type() == QEvent.Type.Resize:
                 self.setGeometry(self._window.rect())
+        elif obj is self._window and event.type() == QEvent.Type.WindowStateChange:
+            _GlobalFlashCoordinator.get().on_window_state_changed(self)
         return super().eventFilter(obj, event)
 
     def _invalidate_geometry_cache(self):
@@ -502,15 +646,16 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
         visible: Set[str] = set()
 
         if self._cache.valid:
+            w, h = self.width(), self.height()
             for key in keys:
-                cached_rects = self._cache.element_rects.get(key, [])
-                for rect_tuple in cached_rects:
-                    if rect_tuple is None:
-                        continue
-                    rect, _ = rect_tuple
-                    if rect is not None and rect.isValid() and rect.intersects(self.rect()):
-                        visible.add(key)
-                        break
+                row_range = self._key_rows.get(key)
+                if row_range is None:
+                    continue
+                if any(
+                    x < w and y < h and x + rw > 0 and y + rh > 0
+                    for x, y, rw, rh, _ in self._row_geom[row_range[0]:row_range[1]]
+                ):
+                    visible.add(key)
         else:
             for key in keys:
                 elements = self._elements.get(key)
@@ -550,6 +695,11 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
         self._cache.element_rects.clear()
         self._cache.element_regions.clear()
 
+        row_geom: List[Tuple[float, float, float, float, float]] = []
+        row_key_idx: List[int] = []
+        key_index: Dict[str, int] = {}
+        key_rows: Dict[str, Tuple[int, int]] = {}
+
         for key, elements in self._elements.items():
             rects = []
             regions = []
@@ -573,6 +723,26 @@ class WindowFlashOverlayGL(QOpenGLWidget if OPENGL_AVAILABLE else object):
             self._cache.element_rects[key] = rects
             self._cache.element_regions[key] = regions
 
+            start = len(row_geom)
+            for rect_tuple in rects:
+                if rect_tuple is None:
+                    continue
+                rect, radius = rect_tuple
+                row_geom.append((rect.x(), rect.y(), rect.width(), rect.height(), radius))
+            if len(row_geom) > start:
+                k = len(key_index)
+                key_index[key] = k
+                key_rows[key] = (start, len(row_geom))
+                row_key_idx.extend([k] * (len(row_geom) - start))
+
+        if np is not None:
+            self._row_geom = np.array(row_geom, dtype=np.float32).reshape(-1, 5)
+            self._row_key_idx = np.array(row_key_idx, dtype=np.int32)
+        else:
+            self._row_geom = row_geom
+            self._row_key_idx = row_key_idx
+        self._key_index = key_index
+        self._key_rows = key_rows
         self._cache.valid = True
 
 
@@ -5,17 +5,38 @@ Pure PyQt6 utility components with zero external dependencies.
 Foundational widgets and helpers with no domain-specific logic.
 """
 
-from .debounce_timer import DebounceTimer
-from .reorderable_list_widget import ReorderableListWidget
-from .background_task import BackgroundTask, BackgroundTaskManager
-from .collapsible_splitter_helper import CollapsibleSplitterHelper
-from .rich_text_appender import RichTextAppender
-
-__all__ = [
-    "DebounceTimer",
-    "ReorderableListWidget",
-    "BackgroundTask",
-    "BackgroundTaskManager",
-    "CollapsibleSplitterHelper",
-    "RichTextAppender",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .debounce_timer import DebounceTimer
+    from .reorderable_list_widget import ReorderableListWidget
+    from .background_task import BackgroundTask, BackgroundTaskManager
+    from .collapsible_splitter_helper import CollapsibleSplitterHelper
+    from .rich_text_appender import RichTextAppender
+
+# Resolved on first access so non-GUI submodules (log_utils, path_cache, ...)
+# can be imported without loading PyQt6.QtWidgets
+_EXPORTS = {
+    "DebounceTimer": ("pyqt_formgen.core.debounce_timer", "DebounceTimer"),
+    "ReorderableListWidget": ("pyqt_formgen.core.reorderable_list_widget", "ReorderableListWidget"),
+    "BackgroundTask": ("pyqt_formgen.core.background_task", "BackgroundTask"),
+    "BackgroundTaskManager": ("pyqt_formgen.core.background_task", "BackgroundTaskManager"),
+    "CollapsibleSplitterHelper": ("pyqt_formgen.core.collapsible_splitter_helper", "CollapsibleSplitterHelper"),
+    "RichTextAppender": ("pyqt_formgen.core.rich_text_appender", "RichTextAppender"),
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        module_name, attr = _EXPORTS[name]
+        module = importlib.import_module(module_name)
+        value = getattr(module, attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_EXPORTS.keys())
@@ -5,13 +5,27 @@ Delegates code generation to the registered CodegenProvider.
 
 from typing import Any, Optional
 
-from pyqt_formgen.protocols import get_codegen_provider
+# Provider resolved on first use; reset by register_codegen_provider()
+_CACHED_PROVIDER = None
+
+
+def invalidate_codegen_provider_cache() -> None:
+    """Drop the cached provider so the next call re-resolves it."""
+    global _CACHED_PROVIDER
+    _CACHED_PROVIDER = None
 
 
 def _require_provider():
+    global _CACHED_PROVIDER
+    provider = _CACHED_PROVIDER
+    if provider is not None:
+        return provider
+    from pyqt_formgen.protocols import get_codegen_provider
+
     provider = get_codegen_provider()
     if provider is None:
         raise RuntimeError("No codegen provider registered. Call register_codegen_provider(...).")
+    _CACHED_PROVIDER = provider
     return provider
 
 
@@ -12,6 +12,21 @@ from PyQt6.QtWidgets import QSplitter
 logger = logging.getLogger(__name__)
 
 
+class _SplitterHandleFilter(QObject):
+    """Event filter for splitter handle to detect double-clicks."""
+
+    def __init__(self, helper: 'CollapsibleSplitterHelper'):
+        # Parented to the splitter so the filter lives exactly as long as it
+        super().__init__(helper.splitter)
+        self.helper = helper
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.MouseButtonDblClick:
+            self.helper.toggle_visibility()
+            return True
+        return False
+
+
 class CollapsibleSplitterHelper:
     """Helper for adding double-click toggle to splitter handles."""
     
@@ -25,6 +40,8 @@ class CollapsibleSplitterHelper:
         """
         self.splitter = splitter
         self.left_panel_index = left_panel_index
+        # Panel that absorbs the space (first panel that isn't the left one)
+        self._other_panel_index = 1 if left_panel_index == 0 else 0
         self._tree_visible = True
         self._tree_last_size = 300  # Default last size
         
@@ -33,57 +50,37 @@ class CollapsibleSplitterHelper:
     
     def _install_handle_filter(self):
         """Install event filter on splitter handle for double-click toggle."""
-        class SplitterHandleFilter(QObject):
-            """Event filter for splitter handle to detect double-clicks."""
-            def __init__(self, helper):
-                super().__init__()
-                self.helper = helper
-            
-            def eventFilter(self, obj, event):
-                if event.type() == QEvent.Type.MouseButtonDblClick:
-                    self.helper.toggle_visibility()
-                    return True
-                return False
-        
         # Get the splitter handle (index 1 is the handle between widgets 0 and 1)
         handle = self.splitter.handle(1)
         if handle:
-            self._handle_filter = SplitterHandleFilter(self)
+            self._handle_filter = _SplitterHandleFilter(self)
             handle.installEventFilter(self._handle_filter)
     
     def toggle_visibility(self):
         """Toggle left panel visibility by collapsing/expanding."""
         sizes = self.splitter.sizes()
-        
-        if self._tree_visible and sizes[self.left_panel_index] > 0:
-            # Panel is visible - collapse it
-            self._tree_last_size = sizes[self.left_panel_index]  # Remember current size
-            total = sum(sizes)
-            new_sizes = [0] * len(sizes)
-            new_sizes[self.left_panel_index] = 0
-            # Give all space to other panels
-            remaining = total
-            for i in range(len(sizes)):
-                if i != self.left_panel_index:
-                    new_sizes[i] = remaining
-                    break
-            self.splitter.setSizes(new_sizes)
-            self._tree_visible = False
+        total = sum(sizes)
+        left = self.left_panel_index
+        collapsing = self._tree_visible and sizes[left] > 0
+
+        if collapsing:
+            # Panel is visible - collapse it, remembering current size
+            self._tree_last_size = sizes[left]
+            new_left_size = 0
+        else:
+            # Panel is collapsed - expand it (right panel keeps at least 100px)
+            new_left_size = min(self._tree_last_size, total - 100)
+
+        # Left panel gets new_left_size, first other panel gets the rest
+        new_sizes = [0] * len(sizes)
+        new_sizes[left] = new_left_size
+        new_sizes[self._other_panel_index] = total - new_left_size
+        self.splitter.setSizes(new_sizes)
+        self._tree_visible = not collapsing
+
+        if collapsing:
             logger.debug("Collapsed left panel")
         else:
-            # Panel is collapsed - expand it
-            total = sum(sizes)
-            new_left_size = min(self._tree_last_size, total - 100)  # Ensure right panel has at least 100px
-            new_sizes = [0] * len(sizes)
-            new_sizes[self.left_panel_index] = new_left_size
-            # Give remaining space to other panels
-            remaining = total - new_left_size
-            for i in range(len(sizes)):
-                if i != self.left_panel_index:
-                    new_sizes[i] = remaining
-                    break
-            self.splitter.setSizes(new_sizes)
-            self._tree_visible = True
             logger.debug(f"Expanded left panel to {new_left_size}px")
     
     def set_initial_size(self, size: int):
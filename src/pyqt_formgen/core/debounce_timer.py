@@ -1,6 +1,6 @@
 """Reusable trailing debounce timer."""
 
-from typing import Callable, Optional
+from typing import Callable
 from PyQt6.QtCore import QTimer
 
 
@@ -20,26 +20,20 @@ class DebounceTimer:
     def __init__(self, delay_ms: int, handler: Callable[[], None]):
         self._delay_ms = delay_ms
         self._handler = handler
-        self._timer: Optional[QTimer] = None
+        # One single-shot timer for the lifetime of the debouncer; start() restarts it
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(handler)
 
     def trigger(self):
         """Trigger debounce — restarts timer."""
-        if self._timer is not None:
-            self._timer.stop()
-
-        self._timer = QTimer()
-        self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._handler)
         self._timer.start(self._delay_ms)
 
     def cancel(self):
         """Cancel pending trigger."""
-        if self._timer is not None:
-            self._timer.stop()
-            self._timer = None
+        self._timer.stop()
 
     def force(self):
         """Cancel timer and fire handler immediately."""
-        self.cancel()
+        self._timer.stop()
         self._handler()
-
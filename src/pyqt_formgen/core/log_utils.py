@@ -6,35 +6,95 @@ shared between UI implementations.
 """
 
 import logging
+import os
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Dict, Iterator, Optional, List, Set, Tuple
 from dataclasses import dataclass
 
-from pyqt_formgen.protocols import get_form_config
-
 logger = logging.getLogger(__name__)
 
 
-def _get_log_dir() -> Path:
-    """Return configured log directory or default."""
+# Config-derived log settings, resolved on first use (see reset_log_config_cache)
+_log_config_loaded = False
+_log_dir: Optional[Path] = None
+_log_prefixes: Tuple[str, ...] = ()
+_log_root_logger_name: Optional[str] = None
+_app_log_patterns: Tuple[str, ...] = ()
+# suffix -> (prefix + suffix candidates, {candidate: prefix})
+_prefixed_candidates: Dict[str, Tuple[Tuple[str, ...], Dict[str, str]]] = {}
+# (startswith tuple, handler) dispatch for classify_log_file; built from prefixes
+_classifiers: Optional[List[Tuple[Tuple[str, ...], Callable[[Path, str], Optional['LogFileInfo']]]]] = None
+
+# Common auxiliary logs recognized alongside the configured prefixes
+_EXTRA_APP_LOG_PATTERNS = (
+    "pyqt_gui_subprocess_",
+    "zmq_worker_",
+    "napari_detached_",
+)
+
+
+def _load_log_config() -> None:
+    """Resolve log settings from the form config once."""
+    global _log_config_loaded, _log_dir, _log_prefixes, _log_root_logger_name, _app_log_patterns
+    global _classifiers
+    from pyqt_formgen.protocols import get_form_config
+
     config = get_form_config()
     if config.log_dir:
-        return Path(config.log_dir)
-    return Path.home() / ".local" / "share" / "pyqt_formgen" / "logs"
+        _log_dir = Path(config.log_dir)
+    else:
+        _log_dir = Path.home() / ".local" / "share" / "pyqt_formgen" / "logs"
+    _log_prefixes = tuple(config.log_prefixes or ("pyqt_formgen_",))
+    _log_root_logger_name = config.log_root_logger_name
+    _app_log_patterns = (*_log_prefixes, *_EXTRA_APP_LOG_PATTERNS)
+    _prefixed_candidates.clear()
+    _classifiers = None
+    _log_config_loaded = True
+
+
+def reset_log_config_cache() -> None:
+    """Drop cached log settings so the next lookup re-reads the form config."""
+    global _log_config_loaded, _classifiers
+    _log_config_loaded = False
+    _prefixed_candidates.clear()
+    _classifiers = None
 
 
-def _get_log_prefixes() -> List[str]:
+def _get_log_dir() -> Path:
+    """Return configured log directory or default."""
+    if not _log_config_loaded:
+        _load_log_config()
+    return _log_dir
+
+
+def _get_log_prefixes() -> Tuple[str, ...]:
     """Return configured log prefixes or default."""
-    config = get_form_config()
-    return config.log_prefixes or ["pyqt_formgen_"]
+    if not _log_config_loaded:
+        _load_log_config()
+    return _log_prefixes
+
+
+def _get_prefixed_candidates(suffix: str) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+    """Return (prefix+suffix candidates, {candidate: prefix}) for the configured prefixes."""
+    entry = _prefixed_candidates.get(suffix)
+    if entry is None:
+        prefixes = _get_log_prefixes()
+        candidates = tuple(f"{prefix}{suffix}" for prefix in prefixes)
+        entry = (candidates, dict(zip(candidates, prefixes)))
+        _prefixed_candidates[suffix] = entry
+    return entry
 
 
 def _match_prefixed(file_name: str, suffix: str) -> Optional[str]:
     """Return matching prefix for a file name if it starts with prefix+suffix."""
-    for prefix in _get_log_prefixes():
-        if file_name.startswith(f"{prefix}{suffix}"):
-            return prefix
+    candidates, candidate_to_prefix = _get_prefixed_candidates(suffix)
+    # C-level tuple startswith rejects non-matching names in one call
+    if not file_name.startswith(candidates):
+        return None
+    for candidate in candidates:
+        if file_name.startswith(candidate):
+            return candidate_to_prefix[candidate]
     return None
 
 
@@ -48,9 +108,10 @@ def get_current_log_file_path() -> str:
                 return handler.baseFilename
 
         # Fallback: try to get from configured logger name
-        config = get_form_config()
-        if config.log_root_logger_name:
-            root_named_logger = logging.getLogger(config.log_root_logger_name)
+        if not _log_config_loaded:
+            _load_log_config()
+        if _log_root_logger_name:
+            root_named_logger = logging.getLogger(_log_root_logger_name)
             for handler in root_named_logger.handlers:
                 if isinstance(handler, logging.FileHandler):
                     return handler.baseFilename
@@ -58,7 +119,7 @@ def get_current_log_file_path() -> str:
         # Last resort: create a default path
         log_dir = _get_log_dir()
         log_dir.mkdir(parents=True, exist_ok=True)
-        prefix = (_get_log_prefixes() or ["pyqt_formgen_"])[0]
+        prefix = (_get_log_prefixes() or ("pyqt_formgen_",))[0]
         return str(log_dir / f"{prefix}subprocess_{int(time.time())}.log")
 
     except Exception as e:
@@ -66,7 +127,11 @@ def get_current_log_file_path() -> str:
         raise RuntimeError(f"Could not determine log file path: {e}")
 
 
-@dataclass
+# Fallback display names for log types that don't carry a worker id
+_DEFAULT_DISPLAY_NAMES: Dict[str, str] = {"tui": "Main Process", "main": "Main Subprocess"}
+
+
+@dataclass(slots=True)
 class LogFileInfo:
     """Information about a discovered log file."""
     path: Path
@@ -76,15 +141,25 @@ class LogFileInfo:
 
     def __post_init__(self):
         """Generate display name if not provided."""
-        if not self.display_name:
-            if self.log_type == "tui":
-                self.display_name = "Main Process"
-            elif self.log_type == "main":
-                self.display_name = "Main Subprocess"
-            elif self.log_type == "worker" and self.worker_id:
-                self.display_name = f"Worker {self.worker_id}"
-            else:
-                self.display_name = self.path.name
+        if self.display_name:
+            return
+        if self.log_type == "worker" and self.worker_id:
+            self.display_name = f"Worker {self.worker_id}"
+        else:
+            self.display_name = _DEFAULT_DISPLAY_NAMES.get(self.log_type, self.path.name)
+
+
+@dataclass(frozen=True, slots=True)
+class _BaseLogSpec:
+    """File names derived from a subprocess base log path, computed once per base."""
+    base_name: str
+    main_log_name: str
+    worker_prefix: str
+
+    @classmethod
+    def from_base_log_path(cls, base_log_path: str) -> "_BaseLogSpec":
+        base_name = Path(base_log_path).name
+        return cls(base_name, f"{base_name}.log", f"{base_name}_worker_")
 
 
 def discover_logs(base_log_path: Optional[str] = None, include_main_log: bool = True,
@@ -101,15 +176,18 @@ def discover_logs(base_log_path: Optional[str] = None, include_main_log: bool =
         List of LogFileInfo objects for discovered log files
     """
     discovered_logs = []
+    seen: Set[str] = set()
+
+    # Resolve the current log once for every classification below
+    current_log = _resolve_current_log_path() if include_main_log else None
 
     # Include current main process log if requested
-    if include_main_log:
+    if current_log is not None:
         try:
-            main_log_path = get_current_log_file_path()
-            main_log = Path(main_log_path)
-            if main_log.exists():
-                log_info = classify_log_file(main_log, base_log_path, include_main_log)
-                discovered_logs.append(log_info)
+            if current_log.exists():
+                # Known to be the TUI log; no need to run it through classification
+                discovered_logs.append(LogFileInfo(current_log, "tui", display_name="Main Process"))
+                seen.add(str(current_log))
         except Exception:
             pass  # Main log not available, continue
 
@@ -117,11 +195,15 @@ def discover_logs(base_log_path: Optional[str] = None, include_main_log: bool =
     if base_log_path:
         base_path = Path(base_log_path)
         log_dir = base_path.parent
+        spec = _BaseLogSpec.from_base_log_path(base_log_path)
         if log_dir.exists():
-            for log_file in log_dir.glob("*.log"):
-                if is_relevant_log_file(log_file, base_log_path):
-                    log_info = classify_log_file(log_file, base_log_path, include_main_log)
-                    discovered_logs.append(log_info)
+            for entry in _scan_log_files(log_dir):
+                if entry.path in seen or not _is_relevant_log_name(entry.name, spec):
+                    continue
+                log_file = Path(entry.path)
+                log_info = _classify_with_spec(log_file, spec, current_log)
+                discovered_logs.append(log_info)
+                seen.add(entry.path)
 
     # Discover all logs if no specific base_log_path
     elif log_directory or not base_log_path:
@@ -129,16 +211,35 @@ def discover_logs(base_log_path: Optional[str] = None, include_main_log: bool =
             log_directory = _get_log_dir()
 
         if log_directory.exists():
-            for log_file in log_directory.glob("*.log"):
-                if is_app_log_file(log_file) and log_file not in [log.path for log in discovered_logs]:
-                    # Infer base_log_path for proper classification
-                    inferred_base = infer_base_log_path(log_file) if 'subprocess_' in log_file.name else None
-                    log_info = classify_log_file(log_file, inferred_base, include_main_log)
-                    discovered_logs.append(log_info)
+            # Many worker logs share one inferred base; build each spec once
+            specs: Dict[str, _BaseLogSpec] = {}
+            for entry in _scan_log_files(log_directory):
+                name = entry.name
+                if entry.path in seen or not _is_app_log_name(name):
+                    continue
+                log_file = Path(entry.path)
+                # Infer base_log_path for proper classification
+                spec = None
+                if 'subprocess_' in name:
+                    inferred_base = infer_base_log_path(log_file)
+                    spec = specs.get(inferred_base)
+                    if spec is None:
+                        spec = specs[inferred_base] = _BaseLogSpec.from_base_log_path(inferred_base)
+                log_info = _classify_with_spec(log_file, spec, current_log)
+                discovered_logs.append(log_info)
+                seen.add(entry.path)
 
     return discovered_logs
 
 
+def _scan_log_files(log_dir: Path) -> Iterator[os.DirEntry]:
+    """Yield ``*.log`` directory entries (one scandir pass, no per-entry stat)."""
+    with os.scandir(log_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.log'):
+                yield entry
+
+
 def classify_log_file(log_path: Path, base_log_path: Optional[str] = None, include_tui_log: bool = True) -> LogFileInfo:
     """
     Pure function: Classify a log file and extract metadata.
@@ -151,51 +252,82 @@ def classify_log_file(log_path: Path, base_log_path: Optional[str] = None, inclu
     Returns:
         LogFileInfo with classification and metadata
     """
+    current_log = _resolve_current_log_path() if include_tui_log else None
+    spec = _BaseLogSpec.from_base_log_path(base_log_path) if base_log_path else None
+    return _classify_with_spec(log_path, spec, current_log)
+
+
+def _resolve_current_log_path() -> Optional[Path]:
+    """Current process log as a Path, or None if it cannot be determined."""
+    try:
+        return Path(get_current_log_file_path())
+    except RuntimeError:
+        return None  # TUI log not found, continue with other classification
+
+
+def _classify_zmq_server(log_path: Path, file_name: str) -> Optional[LogFileInfo]:
+    """ZMQ server logs: <prefix>zmq_server_port_{port}_{timestamp}.log"""
+    prefix = _match_prefixed(file_name, "zmq_server_port_")
+    # Extract port from filename
+    parts = file_name.replace(f'{prefix}zmq_server_port_', '').replace('.log', '').split('_')
+    port = parts[0] if parts else 'unknown'
+    return LogFileInfo(log_path, "zmq_server", display_name=f"ZMQ Server (port {port})")
+
+
+def _classify_zmq_worker(log_path: Path, file_name: str) -> Optional[LogFileInfo]:
+    """ZMQ worker logs: zmq_worker_exec_{exec_id}_worker_{pid}_*.log"""
+    # Extract execution ID and worker PID
+    parts = file_name.replace('zmq_worker_exec_', '').replace('.log', '').split('_worker_')
+    if len(parts) == 2:
+        worker_pid = parts[1].split('_')[0]  # PID is first part after _worker_
+        return LogFileInfo(log_path, "zmq_worker", worker_pid, display_name=f"ZMQ Worker {worker_pid}")
+    return None
+
+
+def _classify_napari(log_path: Path, file_name: str) -> Optional[LogFileInfo]:
+    """Napari viewer logs: napari_detached_port_{port}.log"""
+    port = file_name.replace('napari_detached_port_', '').replace('.log', '')
+    return LogFileInfo(log_path, "napari", display_name=f"Napari Viewer (port {port})")
+
+
+def _get_classifiers() -> List[Tuple[Tuple[str, ...], Callable[[Path, str], Optional[LogFileInfo]]]]:
+    """Build the filename dispatch table once per log config (checked in order)."""
+    global _classifiers
+    if _classifiers is None:
+        _classifiers = [
+            (_get_prefixed_candidates("zmq_server_port_")[0], _classify_zmq_server),
+            (("zmq_worker_exec_",), _classify_zmq_worker),
+            (("napari_detached_port_",), _classify_napari),
+        ]
+    return _classifiers
+
+
+def _classify_with_spec(log_path: Path, spec: Optional[_BaseLogSpec],
+                        current_log: Optional[Path]) -> LogFileInfo:
+    """classify_log_file with the base spec and current log path already resolved."""
     file_name = log_path.name
 
     # Check if it's the current TUI log
-    if include_tui_log:
-        try:
-            tui_log_path = get_current_log_file_path()
-            if log_path == Path(tui_log_path):
-                return LogFileInfo(log_path, "tui", display_name="Main Process")
-        except RuntimeError:
-            pass  # TUI log not found, continue with other classification
+    if current_log is not None and log_path == current_log:
+        return LogFileInfo(log_path, "tui", display_name="Main Process")
 
-    # Check for ZMQ server logs (<prefix>zmq_server_port_{port}_{timestamp}.log)
-    prefix = _match_prefixed(file_name, "zmq_server_port_")
-    if prefix:
-        # Extract port from filename
-        parts = file_name.replace(f'{prefix}zmq_server_port_', '').replace('.log', '').split('_')
-        port = parts[0] if parts else 'unknown'
-        return LogFileInfo(log_path, "zmq_server", display_name=f"ZMQ Server (port {port})")
-
-    # Check for ZMQ worker logs
-    if file_name.startswith('zmq_worker_exec_'):
-        # Extract execution ID and worker PID
-        parts = file_name.replace('zmq_worker_exec_', '').replace('.log', '').split('_worker_')
-        if len(parts) == 2:
-            exec_id_short = parts[0][:8]  # First 8 chars of UUID
-            worker_pid = parts[1].split('_')[0]  # PID is first part after _worker_
-            return LogFileInfo(log_path, "zmq_worker", worker_pid, display_name=f"ZMQ Worker {worker_pid}")
-
-    # Check for Napari viewer logs
-    if file_name.startswith('napari_detached_port_'):
-        port = file_name.replace('napari_detached_port_', '').replace('.log', '')
-        return LogFileInfo(log_path, "napari", display_name=f"Napari Viewer (port {port})")
+    # Filename-pattern logs: one C-level startswith(tuple) per classifier
+    for patterns, handler in _get_classifiers():
+        if file_name.startswith(patterns):
+            log_info = handler(log_path, file_name)
+            if log_info is not None:
+                return log_info
 
     # Check subprocess logs if base_log_path is provided
-    if base_log_path:
-        base_name = Path(base_log_path).name
-
+    if spec is not None:
         # Check if it's the main subprocess log: exact match
-        if file_name == f"{base_name}.log":
+        if file_name == spec.main_log_name:
             return LogFileInfo(log_path, "main", display_name="Main Subprocess")
 
         # Check if it's a worker log: {base_name}_worker_*.log
-        if file_name.startswith(f"{base_name}_worker_") and file_name.endswith('.log'):
+        if file_name.startswith(spec.worker_prefix) and file_name[-4:] == '.log':
             # Extract worker ID (everything between _worker_ and .log)
-            worker_part = file_name[len(f"{base_name}_worker_"):-4]  # Remove .log suffix
+            worker_part = file_name[len(spec.worker_prefix):-4]  # Remove .log suffix
             worker_id = worker_part.split('_')[0]  # Take first part before any additional underscores
             return LogFileInfo(log_path, "worker", worker_id, display_name=f"Worker {worker_id}")
 
@@ -218,14 +350,16 @@ def is_relevant_log_file(file_path: Path, base_log_path: Optional[str]) -> bool:
     if not base_log_path:
         return False
 
-    base_name = Path(base_log_path).name
-    file_name = file_path.name
+    return _is_relevant_log_name(file_path.name, _BaseLogSpec.from_base_log_path(base_log_path))
+
 
+def _is_relevant_log_name(file_name: str, spec: _BaseLogSpec) -> bool:
+    """Name-only check behind is_relevant_log_file."""
     # Check if it matches our patterns
-    if file_name == f"{base_name}.log":
+    if file_name == spec.main_log_name:
         return True
 
-    if file_name.startswith(f"{base_name}_worker_") and file_name.endswith('.log'):
+    if file_name.startswith(spec.worker_prefix) and file_name[-4:] == '.log':
         return True
 
     return False
@@ -241,21 +375,19 @@ def is_app_log_file(file_path: Path) -> bool:
     Returns:
         bool: True if file matches configured log prefixes
     """
-    if not file_path.name.endswith('.log'):
-        return False
+    return _is_app_log_name(file_path.name)
 
-    file_name = file_path.name
+
+def _is_app_log_name(file_name: str) -> bool:
+    """Name-only check behind is_app_log_file."""
+    # Slice compare skips the endswith method lookup/call on every scanned name
+    if file_name[-4:] != '.log':
+        return False
 
     # App log patterns based on configured prefixes, plus common auxiliary logs
-    prefixes = _get_log_prefixes()
-    extra_patterns = [
-        "pyqt_gui_subprocess_",
-        "zmq_worker_",
-        "napari_detached_",
-    ]
-    patterns = [*prefixes, *extra_patterns]
-
-    return any(file_name.startswith(pattern) for pattern in patterns)
+    if not _log_config_loaded:
+        _load_log_config()
+    return file_name.startswith(_app_log_patterns)
 
 
 def infer_base_log_path(file_path: Path) -> str:
@@ -5,14 +5,29 @@ Provides shared path caching functionality for both TUI and PyQt GUI implementat
 Persists last used paths across application runs for improved user experience.
 """
 
+import atexit
 import json
 import logging
+import os
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib encoder
+
 logger = logging.getLogger(__name__)
 
+# A cached path that passed exists() within this window is trusted without a new stat
+_EXISTS_CHECK_TTL_S = 5.0
+# Trailing delay before a burst of cache updates is written to disk
+_SAVE_DELAY_S = 0.5
+
 
 class PathCacheKey(Enum):
     """
@@ -44,6 +59,60 @@ class PathCacheKey(Enum):
     ANALYSIS_BROWSER = "analysis_browser"
 
 
+# Enum .value goes through a descriptor; hot paths use this plain dict instead
+_KEY_STRS: Dict[PathCacheKey, str] = {key: key.value for key in PathCacheKey}
+
+# Debounced saves for every cache are written by one shared daemon thread.
+# Caches are held weakly, so neither the worker nor the exit hook keeps one alive.
+_live_caches: "weakref.WeakSet[UnifiedPathCache]" = weakref.WeakSet()
+_save_cond = threading.Condition()
+_save_worker: Optional[threading.Thread] = None
+
+
+def _due_caches(now: float) -> Tuple[List["UnifiedPathCache"], Optional[float]]:
+    """Caches whose save is due, and the earliest deadline among the rest (caller holds _save_cond)."""
+    due: List[UnifiedPathCache] = []
+    next_due: Optional[float] = None
+    for cache in _live_caches:
+        save_due = cache._save_due
+        if save_due is None:
+            continue
+        if save_due <= now:
+            due.append(cache)
+        elif next_due is None or save_due < next_due:
+            next_due = save_due
+    return due, next_due
+
+
+def _run_save_worker() -> None:
+    """Flush each cache once its save delay has elapsed."""
+    while True:
+        with _save_cond:
+            now = time.monotonic()
+            due, next_due = _due_caches(now)
+            if not due:
+                _save_cond.wait(next_due - now if next_due is not None else None)
+                continue
+        for cache in due:
+            cache.flush()
+        due = cache = None  # Don't hold the caches while waiting
+
+
+def _ensure_save_worker() -> None:
+    """Start the shared save thread on first use (caller holds _save_cond)."""
+    global _save_worker
+    if _save_worker is None:
+        _save_worker = threading.Thread(target=_run_save_worker, name="path-cache-save", daemon=True)
+        _save_worker.start()
+
+
+@atexit.register
+def _flush_all_caches() -> None:
+    """Write pending changes of every live cache at interpreter exit."""
+    for cache in list(_live_caches):
+        cache.flush()
+
+
 class UnifiedPathCache:
     """
     Unified path cache for persisting directory paths across application sessions.
@@ -69,7 +138,24 @@ class UnifiedPathCache:
                 cache_file = Path.home() / ".cache" / "pyqt_formgen" / "path_cache.json"
 
         self.cache_file = cache_file
-        self._cache: Dict[str, str] = {}
+        # Create the cache directory once up front instead of on every write
+        self._dir_ready = False
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        except OSError as e:
+            logger.warning(f"Failed to create path cache directory: {e}")
+        # key -> (raw string as persisted, Path, monotonic time of last exists() check)
+        self._cache: Dict[str, Tuple[str, Path, float]] = {}
+        # Guards _cache mutations and snapshots (callers may be on different threads)
+        self._lock = threading.RLock()
+        # Debounced persistence: latest snapshot waits for the save worker (or exit) to be
+        # written; _pending_save and _save_due are guarded by the module-level _save_cond
+        self._pending_save: Optional[Dict[str, str]] = None
+        self._save_due: Optional[float] = None  # monotonic deadline of the pending save
+        self._save_lock = threading.Lock()  # Serializes file writes
+        with _save_cond:
+            _live_caches.add(self)
         self._load_cache()
         logger.debug(f"UnifiedPathCache initialized with cache file: {self.cache_file}")
     
@@ -77,8 +163,14 @@ class UnifiedPathCache:
         """Load cache from disk."""
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, 'r') as f:
-                    self._cache = json.load(f)
+                if orjson is not None:
+                    raw: Dict[str, str] = orjson.loads(self.cache_file.read_bytes())
+                else:
+                    raw = json.loads(self.cache_file.read_text())
+                # Loaded entries have never been checked: timestamp forces exists() on first get
+                self._cache = {
+                    key: (value, Path(value), float("-inf")) for key, value in raw.items()
+                }
                 logger.debug(f"Loaded path cache with {len(self._cache)} entries")
             else:
                 logger.debug("No existing path cache found, starting fresh")
@@ -87,15 +179,46 @@ class UnifiedPathCache:
             self._cache = {}
     
     def _save_cache(self) -> None:
-        """Save cache to disk."""
+        """Schedule a debounced save of the current cache contents."""
+        # Snapshot on the calling thread so the save worker never iterates _cache
+        with self._lock:
+            snapshot = {key: entry[0] for key, entry in self._cache.items()}
+        with _save_cond:
+            self._pending_save = snapshot
+            self._save_due = time.monotonic() + _SAVE_DELAY_S
+            _ensure_save_worker()
+            _save_cond.notify()
+
+    def flush(self) -> None:
+        """Write any pending cache changes to disk now."""
+        with self._save_lock:
+            with _save_cond:
+                snapshot = self._pending_save
+                self._pending_save = None
+                self._save_due = None
+            if snapshot is None:
+                return
+            self._write_cache_file(snapshot)
+
+    def _write_cache_file(self, data: Dict[str, str]) -> None:
+        """Atomically replace the cache file with ``data``."""
         try:
-            # Ensure cache directory exists
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.cache_file, 'w') as f:
-                json.dump(self._cache, f, indent=2)
-            logger.debug(f"Saved path cache with {len(self._cache)} entries")
+            # Ensure cache directory exists (normally already done in __init__)
+            if not self._dir_ready:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
+
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            # Compact output: the file is machine-read only
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(data))
+            else:
+                tmp_file.write_text(json.dumps(data))
+            os.replace(tmp_file, self.cache_file)
+            logger.debug(f"Saved path cache with {len(data)} entries")
         except OSError as e:
+            # Directory may have been removed since it was created; recheck next time
+            self._dir_ready = False
             logger.warning(f"Failed to save path cache: {e}")
     
     def get_cached_path(self, key: PathCacheKey) -> Optional[Path]:
@@ -108,34 +231,46 @@ class UnifiedPathCache:
         Returns:
             Cached Path if exists and valid, None otherwise
         """
-        cached_str = self._cache.get(key.value)
-        if cached_str:
-            cached_path = Path(cached_str)
+        key_str = _KEY_STRS[key]
+        entry = self._cache.get(key_str)
+        if entry:
+            cached_str, cached_path, checked_at = entry
+            now = time.monotonic()
+            if now - checked_at < _EXISTS_CHECK_TTL_S:
+                return cached_path
             if cached_path.exists():
-                logger.debug(f"Retrieved cached path for {key.value}: {cached_path}")
+                with self._lock:
+                    self._cache[key_str] = (cached_str, cached_path, now)
+                logger.debug(f"Retrieved cached path for {key_str}: {cached_path}")
                 return cached_path
             else:
                 # Remove invalid cached path
-                logger.debug(f"Removing invalid cached path for {key.value}: {cached_path}")
-                del self._cache[key.value]
-                self._save_cache()
+                logger.debug(f"Removing invalid cached path for {key_str}: {cached_path}")
+                with self._lock:
+                    self._cache.pop(key_str, None)
+                    self._save_cache()
         
         return None
     
-    def set_cached_path(self, key: PathCacheKey, path: Path) -> None:
+    def set_cached_path(self, key: PathCacheKey, path: Path, verify: bool = True) -> None:
         """
         Set cached path for a specific key.
         
         Args:
             key: PathCacheKey identifying the context
             path: Path to cache
+            verify: Check that the path exists first; callers holding a path
+                just returned by a file dialog can pass False
         """
-        if path and path.exists():
-            self._cache[key.value] = str(path)
-            self._save_cache()
-            logger.debug(f"Cached path for {key.value}: {path}")
+        key_str = _KEY_STRS[key]
+        if path and (not verify or path.exists()):
+            path = Path(path)
+            with self._lock:
+                self._cache[key_str] = (str(path), path, time.monotonic())
+                self._save_cache()
+            logger.debug(f"Cached path for {key_str}: {path}")
         else:
-            logger.warning(f"Attempted to cache non-existent path for {key.value}: {path}")
+            logger.warning(f"Attempted to cache non-existent path for {key_str}: {path}")
     
     def get_initial_path(self, key: PathCacheKey, fallback: Optional[Path] = None) -> Path:
         """
@@ -162,8 +297,9 @@ class UnifiedPathCache:
     
     def clear_cache(self) -> None:
         """Clear all cached paths."""
-        self._cache.clear()
-        self._save_cache()
+        with self._lock:
+            self._cache.clear()
+            self._save_cache()
         logger.info("Cleared all cached paths")
     
     def remove_cached_path(self, key: PathCacheKey) -> None:
@@ -173,33 +309,41 @@ class UnifiedPathCache:
         Args:
             key: PathCacheKey to remove
         """
-        if key.value in self._cache:
-            del self._cache[key.value]
+        key_str = _KEY_STRS[key]
+        with self._lock:
+            if self._cache.pop(key_str, None) is None:
+                return
             self._save_cache()
-            logger.debug(f"Removed cached path for {key.value}")
+        logger.debug(f"Removed cached path for {key_str}")
 
 
 # Global cache instance
 _global_path_cache: Optional[UnifiedPathCache] = None
+_global_path_cache_lock = threading.Lock()
 
 
 def get_path_cache() -> UnifiedPathCache:
-    """Get global path cache instance."""
+    """Get global path cache instance (created once, thread-safe)."""
     global _global_path_cache
-    if _global_path_cache is None:
-        _global_path_cache = UnifiedPathCache()
-    return _global_path_cache
+    cache = _global_path_cache
+    if cache is not None:
+        return cache
+    with _global_path_cache_lock:
+        if _global_path_cache is None:
+            _global_path_cache = UnifiedPathCache()
+        return _global_path_cache
 
 
-def cache_path(key: PathCacheKey, path: Path) -> None:
+def cache_path(key: PathCacheKey, path: Path, verify: bool = True) -> None:
     """
     Convenience function to cache a path.
     
     Args:
         key: PathCacheKey identifying the context
         path: Path to cache
+        verify: Check that the path exists before caching it
     """
-    get_path_cache().set_cached_path(key, path)
+    get_path_cache().set_cached_path(key, path, verify)
 
 
 def get_cached_path(key: PathCacheKey) -> Optional[Path]:
@@ -230,14 +374,14 @@ def get_initial_path(key: PathCacheKey, fallback: Optional[Path] = None) -> Path
 
 
 # Backward compatibility aliases for existing code
-def cache_browser_path(key: PathCacheKey, path: Path) -> None:
+def cache_browser_path(key: PathCacheKey, path: Path, verify: bool = True) -> None:
     """Backward compatibility alias for TUI code."""
-    cache_path(key, path)
+    cache_path(key, path, verify)
 
 
-def cache_dialog_path(key: PathCacheKey, path: Path) -> None:
+def cache_dialog_path(key: PathCacheKey, path: Path, verify: bool = True) -> None:
     """Backward compatibility alias for PyQt code."""
-    cache_path(key, path)
+    cache_path(key, path, verify)
 
 
 def get_cached_browser_path(key: PathCacheKey, fallback: Optional[Path] = None) -> Path:
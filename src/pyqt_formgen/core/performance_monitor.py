@@ -4,15 +4,25 @@ Provides decorators and context managers for timing operations and
 logging performance metrics.
 """
 
+import atexit
+import os
 import time
+from array import array
 import functools
 import logging
-from contextlib import contextmanager
-from typing import Optional, Callable
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Callable, Dict, List
 from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 from pyqt_formgen.protocols import get_form_config
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Fall back to builtin sum/min/max over the array buffer
+
 # Create performance logger
 _config = get_form_config()
 perf_logger = logging.getLogger(_config.performance_logger_name)
@@ -21,25 +31,56 @@ perf_logger.setLevel(logging.DEBUG)
 # Add file handler for performance logs
 _log_dir = Path(_config.log_dir) if _config.log_dir else Path.home() / '.local' / 'share' / 'pyqt_formgen' / 'logs'
 perf_log_file = _log_dir / _config.performance_log_filename
-perf_log_file.parent.mkdir(parents=True, exist_ok=True)
 
-file_handler = logging.FileHandler(perf_log_file)
-file_handler.setLevel(logging.DEBUG)
-file_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-))
-perf_logger.addHandler(file_handler)
 
-# Also log to console
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)
-console_handler.setFormatter(logging.Formatter(
-    '⏱️  %(message)s'
-))
-perf_logger.addHandler(console_handler)
+def _create_handlers():
+    """Build the file/console handlers and the queue listener feeding them."""
+    perf_log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    file_handler = logging.FileHandler(perf_log_file)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+
+    # Also log to console
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+    console_handler.setFormatter(logging.Formatter(
+        '⏱️  %(message)s'
+    ))
+
+    # Timed code only enqueues records; a background listener does the file/console I/O
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.perf_listener = listener  # Lets a reload find and reuse this setup
+    perf_logger.addHandler(queue_handler)
+    return file_handler, console_handler, queue_handler, listener
+
+
+def _attached_handlers():
+    """Handlers a previous import of this module attached to perf_logger for perf_log_file."""
+    log_path = os.path.abspath(perf_log_file)
+    for handler in perf_logger.handlers:
+        listener = getattr(handler, 'perf_listener', None)
+        if listener is not None and listener.handlers[0].baseFilename == log_path:
+            file_handler, console_handler = listener.handlers
+            return file_handler, console_handler, handler, listener
+    return None
+
+
+# Reloading this module (as test harnesses do) reuses the handlers already on
+# perf_logger instead of opening the file again and attaching duplicates
+file_handler, console_handler, _queue_handler, _listener = _attached_handlers() or _create_handlers()
+
+
+# Shared no-op context returned by timer() when nothing would be logged
+_NULL_TIMER = nullcontext()
 
 
-@contextmanager
 def timer(operation_name: str, threshold_ms: float = 0.0, log_args: bool = False, **kwargs):
     """Context manager for timing operations.
     
@@ -53,13 +94,23 @@ def timer(operation_name: str, threshold_ms: float = 0.0, log_args: bool = False
         with timer("Loading config", threshold_ms=10.0, config_type="GlobalPipelineConfig"):
             config = load_config()
     """
-    start = time.perf_counter()
+    # Nothing would be logged: skip the generator, clock reads and message formatting
+    if not _enabled or not perf_logger.isEnabledFor(logging.DEBUG):
+        return _NULL_TIMER
+    return _timed_block(operation_name, threshold_ms, log_args, kwargs)
+
+
+@contextmanager
+def _timed_block(operation_name: str, threshold_ms: float, log_args: bool, kwargs: dict):
+    threshold_ns = threshold_ms * 1_000_000
+    start = time.perf_counter_ns()
     try:
         yield
     finally:
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        elapsed_ns = time.perf_counter_ns() - start
         
-        if elapsed_ms >= threshold_ms:
+        if elapsed_ns >= threshold_ns:
+            elapsed_ms = elapsed_ns / 1_000_000
             msg = f"{operation_name}: {elapsed_ms:.2f}ms"
             if log_args and kwargs:
                 args_str = ", ".join(f"{k}={v}" for k, v in kwargs.items())
@@ -84,17 +135,24 @@ def timed(operation_name: Optional[str] = None, threshold_ms: float = 0.0):
         nonlocal operation_name
         if operation_name is None:
             operation_name = f"{func.__module__}.{func.__qualname__}"
+        # Bound once per decorated function; the wrapper runs on hot paths
+        is_enabled_for = perf_logger.isEnabledFor
+        log_debug = perf_logger.debug
+        perf_counter_ns = time.perf_counter_ns
+        threshold_ns = threshold_ms * 1_000_000
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.perf_counter()
+            if not _enabled or not is_enabled_for(logging.DEBUG):
+                return func(*args, **kwargs)
+            start = perf_counter_ns()
             try:
                 return func(*args, **kwargs)
             finally:
-                elapsed_ms = (time.perf_counter() - start) * 1000
+                elapsed_ns = perf_counter_ns() - start
                 
-                if elapsed_ms >= threshold_ms:
-                    perf_logger.debug(f"{operation_name}: {elapsed_ms:.2f}ms")
+                if elapsed_ns >= threshold_ns:
+                    log_debug(f"{operation_name}: {elapsed_ns / 1_000_000:.2f}ms")
         
         return wrapper
     return decorator
@@ -115,18 +173,27 @@ class PerformanceMonitor:
     
     def __init__(self, operation_name: str):
         self.operation_name = operation_name
-        self.timings = []
+        # Contiguous int64 nanoseconds rather than a list of boxed floats
+        self._timings_ns = array('q')
         self.current_start = None
+
+    @property
+    def timings(self) -> List[float]:
+        """Recorded timings in milliseconds."""
+        return [t / 1_000_000 for t in self._timings_ns]
     
     @contextmanager
     def measure(self):
         """Measure a single operation."""
-        start = time.perf_counter()
+        if not _enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
         try:
             yield
         finally:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            self.timings.append(elapsed_ms)
+            self._timings_ns.append(time.perf_counter_ns() - start)
     
     def report(self, log_individual: bool = False):
         """Log summary statistics.
@@ -134,17 +201,32 @@ class PerformanceMonitor:
         Args:
             log_individual: Whether to log each individual timing
         """
-        if not self.timings:
-            perf_logger.debug(f"{self.operation_name}: No measurements")
-            return
+        perf_logger.debug(self.summary())
 
-        count = len(self.timings)
-        total_ms = sum(self.timings)
+        if log_individual:
+            for i, timing_ns in enumerate(self._timings_ns, 1):
+                perf_logger.debug(f"  #{i}: {timing_ns / 1_000_000:.2f}ms")
+
+    def summary(self) -> str:
+        """Format summary statistics as a single line."""
+        timings_ns = self._timings_ns
+        if not timings_ns:
+            return f"{self.operation_name}: No measurements"
+
+        count = len(timings_ns)
+        if np is not None:
+            # Zero-copy view of the array buffer; stats run as C loops
+            values = np.frombuffer(timings_ns, dtype=np.int64)
+            total_ns, min_ns, max_ns = int(values.sum()), int(values.min()), int(values.max())
+        else:
+            total_ns, min_ns, max_ns = sum(timings_ns), min(timings_ns), max(timings_ns)
+        # Convert to milliseconds once, for display only
+        total_ms = total_ns / 1_000_000
         avg_ms = total_ms / count
-        min_ms = min(self.timings)
-        max_ms = max(self.timings)
+        min_ms = min_ns / 1_000_000
+        max_ms = max_ns / 1_000_000
 
-        perf_logger.debug(
+        return (
             f"{self.operation_name} - "
             f"Count: {count}, "
             f"Total: {total_ms:.2f}ms, "
@@ -152,18 +234,14 @@ class PerformanceMonitor:
             f"Min: {min_ms:.2f}ms, "
             f"Max: {max_ms:.2f}ms"
         )
-
-        if log_individual:
-            for i, timing in enumerate(self.timings, 1):
-                perf_logger.debug(f"  #{i}: {timing:.2f}ms")
     
     def reset(self):
         """Clear all timings."""
-        self.timings.clear()
+        del self._timings_ns[:]
 
 
 # Global monitors for common operations
-_monitors = {}
+_monitors: Dict[str, PerformanceMonitor] = {}
 
 
 def get_monitor(operation_name: str) -> PerformanceMonitor:
@@ -174,9 +252,10 @@ def get_monitor(operation_name: str) -> PerformanceMonitor:
         with monitor.measure():
             resolve_placeholder(field)
     """
-    if operation_name not in _monitors:
-        _monitors[operation_name] = PerformanceMonitor(operation_name)
-    return _monitors[operation_name]
+    monitor = _monitors.get(operation_name)
+    if monitor is None:
+        monitor = _monitors[operation_name] = PerformanceMonitor(operation_name)
+    return monitor
 
 
 def report_all_monitors():
@@ -185,14 +264,12 @@ def report_all_monitors():
         perf_logger.debug("No performance monitors active")
         return
 
-    perf_logger.debug("=" * 60)
-    perf_logger.debug("PERFORMANCE SUMMARY")
-    perf_logger.debug("=" * 60)
-
-    for monitor in _monitors.values():
-        monitor.report()
-
-    perf_logger.debug("=" * 60)
+    # One record for the whole block: a single enqueue instead of one per line
+    separator = "=" * 60
+    lines = [separator, "PERFORMANCE SUMMARY", separator]
+    lines.extend(monitor.summary() for monitor in _monitors.values())
+    lines.append(separator)
+    perf_logger.debug("\n".join(lines))
 
 
 def reset_all_monitors():
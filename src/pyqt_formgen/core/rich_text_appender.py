@@ -1,12 +1,16 @@
 """Utility for appending HTML content to QTextEdit with proper cursor/scroll handling."""
 
+from __future__ import annotations
+
 import html
-from typing import Optional
-from PyQt6.QtWidgets import QTextEdit
+from typing import TYPE_CHECKING, Optional
 from PyQt6.QtGui import QTextCursor
 
 from pyqt_formgen.theming import ColorScheme
 
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QTextEdit  # only used for annotations
+
 
 class RichTextAppender:
     """
@@ -21,10 +25,18 @@ class RichTextAppender:
 
     def __init__(self, text_edit: QTextEdit, color_scheme: ColorScheme = None):
         self._text_edit = text_edit
+        # Private cursor: appends don't touch the widget's caret (no cursorPositionChanged)
+        self._cursor = QTextCursor(text_edit.document())
         self._color_scheme = color_scheme or ColorScheme()
         self._border_color = self._color_scheme.to_hex(self._color_scheme.border_color)
         self._success_color = self._color_scheme.to_hex(self._color_scheme.status_success)
         self._error_color = self._color_scheme.to_hex(self._color_scheme.status_error)
+        # Code block markup only varies by the escaped code; bake the rest once
+        self._code_prefix = (
+            f'<pre style="border: 1px solid {self._border_color}; padding: 8px; margin: 4px 0; '
+            f"font-family: 'Courier New', monospace; white-space: pre-wrap; word-wrap: break-word;\">"
+        )
+        self._code_suffix = "</pre>"
 
     def append_html(self, html_content: str, add_spacing: bool = True):
         """
@@ -34,14 +46,16 @@ class RichTextAppender:
             html_content: HTML string to append
             add_spacing: Whether to add blank line after
         """
-        cursor = self._text_edit.textCursor()
+        cursor = self._cursor
+        if cursor.document() is not self._text_edit.document():
+            # Widget was given a new document since the last append
+            cursor = self._cursor = QTextCursor(self._text_edit.document())
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        self._text_edit.setTextCursor(cursor)
 
-        self._text_edit.insertHtml(html_content)
+        cursor.insertHtml(html_content)
 
         if add_spacing:
-            self._text_edit.insertHtml("<br><br>")
+            cursor.insertHtml("<br><br>")
 
         self._scroll_to_bottom()
 
@@ -71,18 +85,7 @@ class RichTextAppender:
             code: Code string to display
             language: Optional language hint (for future syntax highlighting)
         """
-        escaped = html.escape(code)
-        html_block = f"""
-        <pre style="
-            border: 1px solid {self._border_color};
-            padding: 8px;
-            margin: 4px 0;
-            font-family: 'Courier New', monospace;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-        ">{escaped}</pre>
-        """
-        self.append_html(html_block, add_spacing=False)
+        self.append_html(self._code_prefix + html.escape(code) + self._code_suffix, add_spacing=False)
 
     def append_error(self, message: str):
         """Append error message in red."""
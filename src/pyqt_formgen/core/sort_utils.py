@@ -5,12 +5,16 @@ from typing import Iterable, List, TypeVar
 
 T = TypeVar("T")
 
+_DIGITS_RE = re.compile(r"(\d+)")
 
-def natural_sort(items: Iterable[T]) -> List[T]:
-    """Return a naturally sorted list for human-friendly ordering."""
-    def sort_key(value: T):
-        parts = re.split(r"(\\d+)", str(value))
-        return [int(p) if p.isdigit() else p.lower() for p in parts]
 
-    return sorted(list(items), key=sort_key)
+def _natural_key(value) -> tuple:
+    """Split into text/number runs; odd positions are always the digit groups."""
+    parts = _DIGITS_RE.split(str(value).lower())
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
 
+def natural_sort(items: Iterable[T]) -> List[T]:
+    """Return a naturally sorted list for human-friendly ordering."""
+    return sorted(items, key=_natural_key)
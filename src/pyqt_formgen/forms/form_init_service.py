@@ -19,10 +19,9 @@ from typing import Any, Dict, Optional, Type, Callable, List, TypeVar
 from enum import Enum, auto
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 import inspect
-import sys
 from abc import ABC
 import logging
-from contextlib import contextmanager
+from contextlib import nullcontext
 
 from python_introspect import UnifiedParameterAnalyzer
 from pyqt_formgen.forms.parameter_form_base import ParameterFormConfig
@@ -30,15 +29,20 @@ from pyqt_formgen.theming.color_scheme import ColorScheme as PyQt6ColorScheme
 from objectstate import get_base_config_type
 
 try:
-    from pyqt_formgen.core.performance_monitor import timer
+    from pyqt_formgen.core.performance_monitor import timer, is_performance_logging_enabled
 except Exception:  # pragma: no cover - optional performance monitoring
-    @contextmanager
     def timer(*args, **kwargs):
-        yield
+        return nullcontext()
+
+    def is_performance_logging_enabled() -> bool:
+        return False
 
 logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
+# getattr default distinguishing "attribute absent" from an explicit None
+_MISSING = object()
+
 
 # ============================================================================
 # Output Dataclasses
@@ -87,6 +91,10 @@ class DerivationContext:
         return not self.is_lazy_dataclass
 
 
+# DerivationContext attributes copied onto the built ParameterFormConfig
+_DERIVED_NAMES = ('context_obj', 'extracted', 'color_scheme')
+
+
 # ============================================================================
 # Build Configuration
 # ============================================================================
@@ -132,25 +140,36 @@ def builder_for(output_type: Type, service_name: str):
 # Initialization Step Factory
 # ============================================================================
 
+# (name, output_type, builder_func) -> generated step class
+_STEP_CACHE: Dict[tuple, Type] = {}
+
+
 class InitializationStepFactory:
     """Factory for creating metaprogrammed initialization step services."""
     
     @staticmethod
     def create_step(name: str, output_type: Type[T], builder_func: Callable[..., T]) -> Type:
-        """Create a service class with a .build() method."""
+        """Create a service class with a .build() method (one class per distinct step)."""
+        key = (name, output_type, builder_func)
+        cached = _STEP_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         def build(*args, **kwargs) -> output_type:
             return builder_func(*args, **kwargs)
         
-        return type(name, (), {
+        step_class = type(name, (), {
             'build': staticmethod(build),
             '__doc__': f"{name} - Metaprogrammed initialization step. Returns: {output_type.__name__}",
             '_output_type': output_type,
             '_builder_func': builder_func,
         })
+        _STEP_CACHE[key] = step_class
+        return step_class
 
 
 # ============================================================================
-# Service Registry Meta
+# Manager Services
 # ============================================================================
 
 # Import service modules
@@ -164,33 +183,57 @@ from pyqt_formgen.services import (
 )
 
 
-class ServiceRegistryMeta(type):
-    """Metaclass that auto-discovers service classes from imported modules."""
+# (field name, service class) for each ManagerServices field, in field order
+_SERVICE_MODULES = (
+    ('enabled_field_styling_service', enabled_field_styling_service.EnabledFieldStylingService),
+    ('enum_dispatch_service', enum_dispatch_service.EnumDispatchService),
+    ('parameter_ops_service', parameter_ops_service.ParameterOpsService),
+    ('signal_service', signal_service.SignalService),
+    ('value_collection_service', value_collection_service.ValueCollectionService),
+    ('widget_service', widget_service.WidgetService),
+)
+
+
+def _build_manager_services_type() -> Type:
+    """Create the ManagerServices dataclass with one field per concrete service."""
+    service_fields = [('service', type(None), field(default=None))]
+    for field_name, service_class in _SERVICE_MODULES:
+        if inspect.isabstract(service_class):
+            continue
+        service_fields.append((field_name, service_class, field(default=None)))
+    return make_dataclass('ManagerServices', service_fields)
 
-    def __new__(mcs, name, bases, namespace):
-        current_module = sys.modules[__name__]
-        service_fields = [('service', type(None), field(default=None))]
 
-        for attr_name in dir(current_module):
-            attr = getattr(current_module, attr_name)
-            if not inspect.ismodule(attr):
-                continue
+# Auto-generated dataclass - one field per concrete service class
+ManagerServices = _build_manager_services_type()
 
-            module_name = attr.__name__.split('.')[-1]
-            class_name = ''.join(word.capitalize() for word in module_name.split('_'))
 
-            if hasattr(attr, class_name):
-                service_class = getattr(attr, class_name)
-                if inspect.isabstract(service_class):
-                    continue
-                service_fields.append((module_name, service_class, field(default=None)))
+# Field layouts are fixed at import; builders iterate these instead of calling fields() per form
+_EXTRACTED_FIELDS = dataclass_fields(ExtractedParameters)
+_EXTRACTED_COMPUTED = tuple(f for f in _EXTRACTED_FIELDS if 'computed' in f.metadata)
+_EXTRACTED_PLAIN = tuple(f.name for f in _EXTRACTED_FIELDS if 'computed' not in f.metadata)
+_EXTRACTED_INITIAL_VALUES = frozenset(
+    f.name for f in _EXTRACTED_FIELDS if 'computed' not in f.metadata and f.metadata.get('initial_values')
+)
 
-        return make_dataclass(name, service_fields)
 
+def _is_zero_arg(cls: Type) -> bool:
+    """True if cls can be constructed without arguments."""
+    try:
+        signature = inspect.signature(cls)
+    except (TypeError, ValueError):
+        return False
+    return all(
+        p.default is not p.empty or p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+        for p in signature.parameters.values()
+    )
 
-class ManagerServices(metaclass=ServiceRegistryMeta):
-    """Auto-generated dataclass - fields created by ServiceRegistryMeta."""
-    pass
+
+# (field name, zero-arg service class or None) for each ManagerServices field
+_SERVICE_FACTORIES = tuple(
+    (f.name, f.type if f.type is not type(None) and _is_zero_arg(f.type) else None)
+    for f in dataclass_fields(ManagerServices)
+)
 
 
 # ============================================================================
@@ -205,13 +248,13 @@ def _auto_generate_builders():
         extracted = {}
         computed = {}
 
-        for fld in dataclass_fields(ExtractedParameters):
-            if 'computed' in fld.metadata:
-                computed[fld.name] = fld.metadata['computed'](object_instance, exclude_params, initial_values)
-                continue
-            extracted[fld.name] = {name: getattr(info, fld.name) for name, info in param_info_dict.items()}
-            if initial_values and fld.metadata.get('initial_values'):
-                extracted[fld.name].update(initial_values)
+        for fld in _EXTRACTED_COMPUTED:
+            computed[fld.name] = fld.metadata['computed'](object_instance, exclude_params, initial_values)
+
+        for fld_name in _EXTRACTED_PLAIN:
+            extracted[fld_name] = {name: getattr(info, fld_name) for name, info in param_info_dict.items()}
+            if initial_values and fld_name in _EXTRACTED_INITIAL_VALUES:
+                extracted[fld_name].update(initial_values)
 
         return ExtractedParameters(**extracted, **computed)
 
@@ -222,20 +265,17 @@ def _auto_generate_builders():
 
         # Check for use_scroll_area override from FormManagerConfig or from_dataclass_instance
         # This allows config window and step editor to disable scroll area creation
+        # Default: only root managers get scroll areas
+        use_scroll_area = not is_nested
         if form_manager_config:
             # Check new API (FormManagerConfig.use_scroll_area field)
-            if hasattr(form_manager_config, 'use_scroll_area') and form_manager_config.use_scroll_area is not None:
-                use_scroll_area = form_manager_config.use_scroll_area
-            # Check old API (temporary _use_scroll_area_override attribute)
-            elif hasattr(form_manager_config, '_use_scroll_area_override'):
-                use_scroll_area = form_manager_config._use_scroll_area_override
+            configured = getattr(form_manager_config, 'use_scroll_area', _MISSING)
+            if configured is not _MISSING and configured is not None:
+                use_scroll_area = configured
             else:
-                use_scroll_area = not is_nested  # Default: only root managers get scroll areas
-        else:
-            use_scroll_area = not is_nested  # Default: only root managers get scroll areas
+                # Check old API (temporary _use_scroll_area_override attribute)
+                use_scroll_area = getattr(form_manager_config, '_use_scroll_area_override', use_scroll_area)
 
-        import logging
-        logger = logging.getLogger(__name__)
         logger.debug(f"🔧 Building config for {field_id}: is_nested={is_nested}, use_scroll_area={use_scroll_area}")
 
         obj_type = type(extracted.object_instance) if extracted.object_instance else None
@@ -247,7 +287,8 @@ def _auto_generate_builders():
         )
 
         ctx = DerivationContext(context_obj, extracted, color_scheme)
-        vars(config).update(vars(ctx))
+        for name in _DERIVED_NAMES:
+            setattr(config, name, getattr(ctx, name))
 
         from pyqt_formgen.forms.parameter_form_service import ParameterAnalysisInput
         analysis_input = ParameterAnalysisInput(
@@ -260,17 +301,10 @@ def _auto_generate_builders():
         return ConfigBuildResult(config, form_structure, ctx.global_config_type, ctx.placeholder_prefix)
 
     def _create_services():
-        services = {}
-        for fld in dataclass_fields(ManagerServices):
-            if fld.type is type(None):
-                services[fld.name] = fld.default
-                continue
-            try:
-                services[fld.name] = fld.type()
-            except TypeError:
-                services[fld.name] = None
-
-        return ManagerServices(**services)
+        return ManagerServices(**{
+            name: factory() if factory is not None else None
+            for name, factory in _SERVICE_FACTORIES
+        })
 
     builder_for(ExtractedParameters, 'ParameterExtractionService')(_extract_parameters)
     builder_for(ParameterFormConfig, 'ConfigBuilderService')(_build_config)
@@ -289,6 +323,23 @@ for output_type, (service_name, builder_func) in _BUILDER_REGISTRY.items():
 # Form Build Orchestrator
 # ============================================================================
 
+def iter_manager_tree(root, descend: Optional[Callable[[Any], bool]] = None):
+    """Yield root and all nested managers depth-first, parents before children.
+
+    A manager's children are read only after the consumer has handled it, so
+    nested managers created while handling a parent are still visited. If
+    given, descend(manager) is asked at that point too; False prunes the
+    manager's subtree.
+    """
+    stack = [root]
+    while stack:
+        manager = stack.pop()
+        yield manager
+        if descend is None or descend(manager):
+            # Reversed so siblings come out in declaration order
+            stack.extend(reversed(manager.nested_managers.values()))
+
+
 class FormBuildOrchestrator:
     """Orchestrates form building with unified async/sync paths."""
 
@@ -297,11 +348,11 @@ class FormBuildOrchestrator:
 
     @staticmethod
     def is_root_manager(manager) -> bool:
-        return manager._parent_manager is None
+        return manager._is_root
 
     @staticmethod
     def is_nested_manager(manager) -> bool:
-        return manager._parent_manager is not None
+        return not manager._is_root
 
     def build_widgets(self, manager, content_layout: QVBoxLayout, param_infos: List[Any], use_async: bool) -> None:
         """Build widgets using unified async/sync path."""
@@ -315,14 +366,19 @@ class FormBuildOrchestrator:
     def _build_widgets_sync(self, manager, content_layout: QVBoxLayout, param_infos: List[Any]) -> None:
         """Synchronous widget creation path."""
         pass  # timer decorator - optional
-        from .parameter_info_types import DirectDataclassInfo, OptionalDataclassInfo
 
+        # Bound once: avoids two attribute lookups per widget in the loop
+        create_widget = manager._create_widget_for_param
+        add_widget = content_layout.addWidget
         with timer(f"      Create {len(param_infos)} parameter widgets", threshold_ms=5.0):
-            for param_info in param_infos:
-                is_nested = isinstance(param_info, (DirectDataclassInfo, OptionalDataclassInfo))
-                with timer(f"        Create widget for {param_info.name}", threshold_ms=2.0):
-                    widget = manager._create_widget_for_param(param_info)
-                    content_layout.addWidget(widget)
+            if is_performance_logging_enabled():
+                for param_info in param_infos:
+                    with timer(f"        Create widget for {param_info.name}", threshold_ms=2.0):
+                        add_widget(create_widget(param_info))
+            else:
+                # Timing off: no per-widget f-string or context manager
+                for param_info in param_infos:
+                    add_widget(create_widget(param_info))
 
         self._execute_post_build_sequence(manager)
 
@@ -338,9 +394,10 @@ class FormBuildOrchestrator:
 
         if sync_params:
             with timer(f"        Create {len(sync_params)} initial widgets (sync)", threshold_ms=5.0):
+                create_widget = manager._create_widget_for_param
+                add_widget = content_layout.addWidget
                 for param_info in sync_params:
-                    widget = manager._create_widget_for_param(param_info)
-                    content_layout.addWidget(widget)
+                    add_widget(create_widget(param_info))
             # NOTE: Don't refresh here - root's _execute_post_build_sequence will do ONE
             # cascading refresh at the end. Refreshing each manager separately causes O(n²) work.
 
@@ -358,10 +415,7 @@ class FormBuildOrchestrator:
 
     def _notify_root_of_completion(self, nested_manager) -> None:
         """Notify root manager that nested manager completed async build."""
-        root_manager = nested_manager._parent_manager
-        while root_manager._parent_manager is not None:
-            root_manager = root_manager._parent_manager
-        root_manager._on_nested_manager_complete(nested_manager)
+        nested_manager._root_manager._on_nested_manager_complete(nested_manager)
 
     def _execute_post_build_sequence(self, manager) -> None:
         """Execute the standard post-build callback sequence."""
@@ -374,40 +428,61 @@ class FormBuildOrchestrator:
             return
 
         with timer("  Apply styling callbacks", threshold_ms=5.0):
-            self._apply_callbacks(manager._on_build_complete_callbacks)
+            for callback in manager._on_build_complete_callbacks:
+                callback()
+            manager._on_build_complete_callbacks.clear()
 
         with timer("  Complete placeholder refresh", threshold_ms=10.0):
             manager._parameter_ops_service.refresh_with_live_context(manager)
 
-        with timer("  Apply post-placeholder callbacks", threshold_ms=5.0):
-            self._apply_callbacks(manager._on_placeholder_refresh_complete_callbacks)
-            for nested_manager in manager.nested_managers.values():
-                self._apply_callbacks(nested_manager._on_placeholder_refresh_complete_callbacks)
-
-        with timer("  Enabled styling refresh", threshold_ms=5.0):
-            manager._apply_to_nested_managers(lambda name, mgr: mgr._enabled_field_styling_service.refresh_enabled_styling(mgr))
-
-        # Initialize dirty indicators for all labels based on current state
+        # Post-placeholder callbacks (root + direct nested), enabled styling (nested only)
+        # and dirty indicators in one pass over the manager tree
+        actions = [self._run_placeholder_callbacks, self._refresh_enabled_styling]
+        # Dirty state lives on the shared ObjectState, so the check holds tree-wide.
         # This handles the case where the form opens with pre-existing dirty state
-        with timer("  Initialize dirty indicators", threshold_ms=5.0):
-            self._initialize_dirty_indicators(manager)
+        if manager.state.dirty_fields:
+            actions.append(self._init_dirty_indicators_for)
+        with timer("  Post-placeholder callbacks, enabled styling, dirty indicators", threshold_ms=5.0):
+            self._walk_all_managers(manager, actions)
 
-    def _initialize_dirty_indicators(self, manager) -> None:
-        """Initialize dirty indicators for all labels in manager and nested managers."""
-        if not manager.state.dirty_fields:
-            return
-        # Refresh all labels in this manager
-        for param_name in manager.labels:
-            manager._update_label_styling(param_name)
-        # Recursively initialize nested managers
-        for nested_manager in manager.nested_managers.values():
-            self._initialize_dirty_indicators(nested_manager)
+    @staticmethod
+    def _walk_all_managers(root, actions: List[Callable[[Any, int], bool]]) -> None:
+        """Visit root and nested managers depth-first, running each action per manager.
+
+        Actions receive (manager, depth) and return False to stop applying themselves
+        to that manager's subtree; the walk ends once no action remains active.
+        """
+        # (depth, actions still active) per manager not yet visited, keyed by id
+        pending = {id(root): (0, tuple(actions))}
+        descend_from = set()
+        for manager in iter_manager_tree(root, descend=lambda m: id(m) in descend_from):
+            depth, active = pending.pop(id(manager))
+            active = tuple(action for action in active if action(manager, depth))
+            if active:
+                descend_from.add(id(manager))
+                for nested in manager.nested_managers.values():
+                    pending[id(nested)] = (depth + 1, active)
 
     @staticmethod
-    def _apply_callbacks(callback_list: List[Callable]) -> None:
-        for callback in callback_list:
+    def _run_placeholder_callbacks(manager, depth: int) -> bool:
+        callbacks = manager._on_placeholder_refresh_complete_callbacks
+        for callback in callbacks:
             callback()
-        callback_list.clear()
+        callbacks.clear()
+        return depth == 0
+
+    @staticmethod
+    def _refresh_enabled_styling(manager, depth: int) -> bool:
+        # The root's enabled styling is applied by its own post-placeholder callback
+        if depth == 0:
+            return True
+        return manager._enabled_field_styling_service.refresh_own_enabled_styling(manager)
+
+    @staticmethod
+    def _init_dirty_indicators_for(manager, depth: int) -> bool:
+        for param_name in manager.labels:
+            manager._update_label_styling(param_name)
+        return True
 
     def should_use_async(self, param_count: int) -> bool:
         return param_count > self.config.use_async_threshold
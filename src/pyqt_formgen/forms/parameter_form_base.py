@@ -5,14 +5,24 @@ This module defines the common interface and shared behavior for both PyQt and T
 parameter form implementations, establishing contracts and providing shared functionality.
 """
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Type, Optional
+from typing import Any, Callable, Dict, Type, Optional
 from dataclasses import dataclass
 
 from pyqt_formgen.forms.parameter_form_constants import CONSTANTS
+from pyqt_formgen.forms.parameter_form_constants import (
+    FIELD_ID_SEPARATOR as _SEP,
+    NONE_STRING_LITERAL as _NONE_LIT,
+    EMPTY_STRING as _EMPTY,
+)
 from .parameter_type_utils import ParameterTypeUtils
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
 @dataclass
 class ParameterFormConfig:
     """
@@ -58,8 +68,7 @@ class ParameterFormConfig:
 
     def with_debug(self, enabled: bool = True, target_params: Optional[set] = None) -> 'ParameterFormConfig':
         """Return a copy with debug settings configured."""
-        import copy
-        config = copy.deepcopy(self)
+        config = copy.copy(self)
         config.enable_debug = enabled
         if target_params is not None:
             config.debug_target_params = target_params
@@ -67,8 +76,7 @@ class ParameterFormConfig:
 
     def with_global_config(self, global_config_type: Type, editing: bool = True) -> 'ParameterFormConfig':
         """Return a copy with global configuration settings."""
-        import copy
-        config = copy.deepcopy(self)
+        config = copy.copy(self)
         config.is_global_config_editing = editing
         config.global_config_type = global_config_type
         return config
@@ -105,6 +113,11 @@ class ParameterFormManagerBase(ABC):
         self.parameters = parameters.copy()
         self.parameter_types = parameter_types
         self.config = config
+        # Per-parameter converters picked once from the declared types
+        self._conv_handlers: Dict[str, Callable[[Any], Any]] = {
+            name: self._build_value_converter(param_type)
+            for name, param_type in parameter_types.items()
+        }
         
         # Initialize shared utilities
         self.type_utils = ParameterTypeUtils()
@@ -113,12 +126,13 @@ class ParameterFormManagerBase(ABC):
         self.nested_managers = {}
         self.widgets = {}
         
-        # Log initialization
-        self.debugger.log_form_manager_operation("form_manager_initialized", {
-            "field_id": config.field_id,
-            "parameter_count": len(parameters),
-            "has_nested_params": any(ParameterTypeUtils.has_dataclass_fields(t) for t in parameter_types.values())
-        })
+        # Log initialization (the nested-type scan only matters for debug output)
+        if config.enable_debug:
+            self.debugger.log_form_manager_operation("form_manager_initialized", {
+                "field_id": config.field_id,
+                "parameter_count": len(parameters),
+                "has_nested_params": any(ParameterTypeUtils.has_dataclass_fields(t) for t in parameter_types.values())
+            })
     
     # Abstract methods that must be implemented by subclasses
     
@@ -215,7 +229,9 @@ class ParameterFormManagerBase(ABC):
             param_name: The parameter name to update
             value: The new value
         """
-        self.debugger.log_parameter_update(param_name, value, "update_parameter")
+        debug_param = self._should_debug_param(param_name)
+        if debug_param:
+            self.debugger.log_parameter_update(param_name, value, "update_parameter")
 
         # Handle nested parameters
         if self._is_nested_parameter(param_name):
@@ -231,7 +247,8 @@ class ParameterFormManagerBase(ABC):
             old_value = self.parameters[param_name]
             self.parameters[param_name] = converted_value
 
-            self.debugger.log_parameter_update(param_name, converted_value, "parameter_stored")
+            if debug_param:
+                self.debugger.log_parameter_update(param_name, converted_value, "parameter_stored")
 
             # Update corresponding widget if it exists
             if param_name in self.widgets:
@@ -244,10 +261,11 @@ class ParameterFormManagerBase(ABC):
         Args:
             defaults: Optional dictionary of default values to use
         """
-        self.debugger.log_form_manager_operation("reset_all_parameters", {
-            "parameter_count": len(self.parameters),
-            "has_custom_defaults": defaults is not None
-        })
+        if self.config.enable_debug:
+            self.debugger.log_form_manager_operation("reset_all_parameters", {
+                "parameter_count": len(self.parameters),
+                "has_custom_defaults": defaults is not None
+            })
 
         # CRITICAL FIX: Iterate over a static list of keys to avoid 'dictionary changed during iteration'
         param_names = list(self.parameters.keys())
@@ -270,8 +288,9 @@ class ParameterFormManagerBase(ABC):
         if default_value is None:
             default_value = self._get_default_value_for_parameter(param_name)
         
-        old_value = self.parameters.get(param_name)
-        self.debugger.log_reset_operation(param_name, old_value, default_value)
+        if self._should_debug_param(param_name):
+            old_value = self.parameters.get(param_name)
+            self.debugger.log_reset_operation(param_name, old_value, default_value)
         
         self.update_parameter(param_name, default_value)
     
@@ -300,60 +319,86 @@ class ParameterFormManagerBase(ABC):
     
     # Protected helper methods
     
+    def _should_debug_param(self, param_name: str) -> bool:
+        """Check debug gating before any log arguments are built."""
+        config = self.config
+        if not config.enable_debug:
+            return False
+        return param_name in (config.debug_target_params or CONSTANTS.DEBUG_TARGET_PARAMS)
+    
     def _is_nested_parameter(self, param_name: str) -> bool:
         """Check if a parameter name represents a nested parameter."""
-        return CONSTANTS.FIELD_ID_SEPARATOR in param_name
+        return _SEP in param_name
     
     def _update_nested_parameter(self, param_name: str, value: Any) -> None:
         """Update a nested parameter by delegating to the appropriate nested manager."""
-        parts = param_name.split(CONSTANTS.FIELD_ID_SEPARATOR)
+        separator = _SEP
+        nested_managers = self.nested_managers
         
-        # Find the nested manager
-        for i in range(1, len(parts)):
-            potential_nested = CONSTANTS.FIELD_ID_SEPARATOR.join(parts[:i])
-            if potential_nested in self.nested_managers:
-                nested_field = CONSTANTS.FIELD_ID_SEPARATOR.join(parts[i:])
-                self.debugger.log_nested_update(potential_nested, nested_field, value)
-                self.nested_managers[potential_nested].update_parameter(nested_field, value)
+        # Find the nested manager: probe each prefix (shortest first), carrying the
+        # head/tail pair forward with partition instead of split + join per candidate
+        potential_nested, found, nested_field = param_name.partition(separator)
+        while found:
+            nested_manager = nested_managers.get(potential_nested)
+            if nested_manager is not None:
+                if self.config.enable_debug:
+                    self.debugger.log_nested_update(potential_nested, nested_field, value)
+                nested_manager.update_parameter(nested_field, value)
                 return
+            next_part, found, nested_field = nested_field.partition(separator)
+            potential_nested = potential_nested + separator + next_part
     
     def _convert_value_to_type(self, value: Any, param_name: str) -> Any:
         """Convert a value to the appropriate type for a parameter."""
-        if param_name not in self.parameter_types or value is None:
+        handler = self._conv_handlers.get(param_name)
+        if handler is None or value is None:
             return value
         
-        param_type = self.parameter_types[param_name]
-        
         # Handle string "None" literal
-        if isinstance(value, str) and value == CONSTANTS.NONE_STRING_LITERAL:
+        if isinstance(value, str) and value == _NONE_LIT:
             return None
         
+        return handler(value)
+
+    @staticmethod
+    def _build_value_converter(param_type: Type) -> Callable[[Any], Any]:
+        """Pick the conversion for a parameter type (non-None values only)."""
         # Handle enum types
         if ParameterTypeUtils.is_enum_type(param_type):
-            return param_type(value)
+            return param_type
         
         # Handle list of enums
         if ParameterTypeUtils.is_list_of_enums(param_type):
-            # If value is already a list (from checkbox group widget), return as-is
-            if isinstance(value, list):
-                return value
             enum_type = ParameterTypeUtils.get_enum_from_list_type(param_type)
-            if enum_type:
+
+            def convert_enum_list(value: Any) -> Any:
+                # If value is already a list (from checkbox group widget), return as-is
+                if isinstance(value, list):
+                    return value
                 return [enum_type(value)]
+            return convert_enum_list
         
         # Handle basic types
-        if param_type == bool and isinstance(value, str):
-            return ParameterTypeUtils.convert_string_to_bool(value)
+        if param_type == bool:
+            def convert_bool(value: Any) -> Any:
+                if isinstance(value, str):
+                    return ParameterTypeUtils.convert_string_to_bool(value)
+                return value
+            return convert_bool
         
-        if param_type in (int, float) and isinstance(value, str):
-            if value == CONSTANTS.EMPTY_STRING:
-                return None
-            try:
-                return param_type(value)
-            except (ValueError, TypeError):
-                return None
+        if param_type in (int, float):
+            def convert_number(value: Any) -> Any:
+                if not isinstance(value, str):
+                    return value
+                if value == _EMPTY:
+                    return None
+                try:
+                    return param_type(value)
+                except (ValueError, TypeError):
+                    return None
+            return convert_number
         
-        return value
+        return _identity
     
     def _get_default_value_for_parameter(self, param_name: str) -> Any:
         """Get the default value for a parameter."""
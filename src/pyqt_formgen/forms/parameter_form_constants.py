@@ -147,3 +147,9 @@ class ParameterFormConstants:
 
 # Create a singleton instance for easy access throughout the codebase
 CONSTANTS = ParameterFormConstants()
+
+# Bare module-level aliases for constants read on hot paths (one global lookup
+# instead of CONSTANTS.<name>)
+FIELD_ID_SEPARATOR = CONSTANTS.FIELD_ID_SEPARATOR
+NONE_STRING_LITERAL = CONSTANTS.NONE_STRING_LITERAL
+EMPTY_STRING = CONSTANTS.EMPTY_STRING
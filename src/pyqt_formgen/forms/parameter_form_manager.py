@@ -1,15 +1,22 @@
 """PyQt parameter form manager - VIEW layer for ObjectState MODEL."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
+import functools
 import logging
-from typing import Any, Dict, Type, Optional, List, Set, Callable
+import operator
+import time
+import weakref
+from typing import Any, Dict, Type, Optional, List, Set, Tuple, Callable
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QColor
 
 from pyqt_formgen.animation import FlashMixin
 # FlashableGroupBox not extracted - OpenHCS specific
-from objectstate import register_hierarchy_relationship, unregister_hierarchy_relationship
+from objectstate import (
+    ObjectState, ObjectStateRegistry, register_hierarchy_relationship, unregister_hierarchy_relationship
+)
+from python_introspect import UnifiedParameterAnalyzer
 
 from .widget_creation_types import ParameterFormManager as ParameterFormManagerABC, _CombinedMeta
 # timer decorator made optional
@@ -22,17 +29,100 @@ from pyqt_formgen.services import SignalService
 from pyqt_formgen.services import FieldChangeDispatcher, FieldChangeEvent
 # LiveContextService deleted - functionality moved to ObjectStateRegistry
 from pyqt_formgen.services import FlagContextManager
-from .form_init_service import FormBuildOrchestrator
-from contextlib import contextmanager
+from .form_init_service import (
+    FormBuildOrchestrator, iter_manager_tree, ExtractedParameters, ConfigBuilderService, ServiceFactoryService
+)
+from .parameter_form_service import ParameterFormService
+from .widget_creation_config import create_widget_parametric
+from pyqt_formgen.protocols.widget_protocols import ValueSettable
+from pyqt_formgen.theming.style_generator import StyleSheetGenerator
+from contextlib import contextmanager, nullcontext
 
 try:
     from pyqt_formgen.core.performance_monitor import timer
 except Exception:  # pragma: no cover - optional performance monitoring
-    @contextmanager
     def timer(*args, **kwargs):
-        yield
+        return nullcontext()
 
 logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class _FlatParameterIndex:
+    """Prefix buckets over an ObjectState's flat dotted parameter paths.
+
+    Built from ObjectState's own direct-path topology, which it re-creates on every
+    structure replacement, and shared by every PFM on that state, so each PFM reads
+    only its own children instead of scanning all N paths.
+    """
+
+    __slots__ = ('direct_paths', 'direct_children', 'descendant_counts')
+
+    def __init__(self, direct_paths: Dict[Any, tuple]):
+        self.direct_paths = direct_paths  # The topology this index was built from
+        # prefix ('' for root) -> [(full_path, field_name)] in state order
+        self.direct_children: Dict[str, List[tuple]] = {}
+        # prefix -> number of paths anywhere below it
+        self.descendant_counts: Dict[str, int] = {}
+        for owner_path, paths in direct_paths.items():
+            self.direct_children[owner_path.value] = [(path.value, path.field_name) for path in paths]
+            for path in paths:
+                owner, sep, _ = path.value.rpartition('.')
+                while sep:
+                    self.descendant_counts[owner] = self.descendant_counts.get(owner, 0) + 1
+                    owner, sep, _ = owner.rpartition('.')
+
+
+_flat_parameter_indexes: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _flat_parameter_index(state) -> _FlatParameterIndex:
+    """Index for state's parameter paths, rebuilt whenever ObjectState re-indexes them."""
+    direct_paths = state._direct_parameter_paths
+    index = _flat_parameter_indexes.get(state)
+    if index is None or index.direct_paths is not direct_paths:
+        index = _flat_parameter_indexes[state] = _FlatParameterIndex(direct_paths)
+    return index
+
+
+# Dataclass parameter info comes from the class declaration, so sibling and repeated
+# nested PFMs of the same dataclass type share one reflection pass
+_dataclass_analyses: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _analyze_target(obj: Any) -> Dict[str, Any]:
+    """UnifiedParameterAnalyzer result for obj, memoized per dataclass type.
+
+    The returned dict may be shared and must not be mutated.
+    """
+    if not is_dataclass(obj) or isinstance(obj, type):
+        return UnifiedParameterAnalyzer.analyze(obj)
+    cls = type(obj)
+    analysis = _dataclass_analyses.get(cls)
+    if analysis is None:
+        analysis = _dataclass_analyses[cls] = UnifiedParameterAnalyzer.analyze(obj)
+    return analysis
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix_getter(prefix: str) -> Callable[[Any], Any]:
+    """attrgetter walking a dotted field_prefix (shared by every PFM with that prefix)."""
+    return operator.attrgetter(prefix)
+
+
+@functools.lru_cache(maxsize=8)
+def _config_window_style_for(scheme_type: type, scheme_values: tuple, layout) -> str:
+    """Generate the config window stylesheet for a scheme snapshot under a layout."""
+    return StyleSheetGenerator(scheme_type(*scheme_values)).generate_config_window_style()
+
+
+def _config_window_style(color_scheme) -> str:
+    """Config window stylesheet for color_scheme, regenerated only when scheme or layout change."""
+    scheme_values = tuple(getattr(color_scheme, f.name) for f in fields(color_scheme))
+    return _config_window_style_for(type(color_scheme), scheme_values, CURRENT_LAYOUT)
+
+
 @dataclass
 class FormManagerConfig:
     """
@@ -107,6 +197,11 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
     ASYNC_WIDGET_CREATION = True  # Create widgets progressively to avoid UI blocking
     ASYNC_THRESHOLD = 5  # Minimum number of parameters to trigger async widget creation
     INITIAL_SYNC_WIDGETS = 10  # Number of widgets to create synchronously for fast initial render
+    ASYNC_BATCH_SIZE = 8  # Widgets in the first async batch; later batches adapt to the budget
+    ASYNC_BATCH_BUDGET_MS = 4.0  # Target time per async batch (one event-loop tick)
+
+    # Resolved-value changes arriving within this window are flashed/refreshed together
+    RESOLVED_FLUSH_MS = 16
 
     @classmethod
     def should_use_async(cls, param_count: int) -> bool:
@@ -132,20 +227,12 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
           PFM with field_prefix='well_filter_config' returns:
           {'well_filter': 2, 'enabled': True}
         """
-        if not self.field_prefix:
-            # Root PFM: return only top-level parameters (no dots)
-            return {k: v for k, v in self.state.parameters.items() if '.' not in k}
-
-        # Nested PFM: filter by prefix and strip prefix from keys
-        prefix_dot = f'{self.field_prefix}.'
-        result = {}
-        for path, value in self.state.parameters.items():
-            if path.startswith(prefix_dot):
-                remainder = path[len(prefix_dot):]
-                # Only direct children (no nested dots in remainder)
-                if '.' not in remainder:
-                    result[remainder] = value
-        return result
+        state = self.state
+        parameters = state.parameters
+        # Root PFM reads top-level parameters (no dots), nested PFMs their direct children
+        prefix = self.field_prefix or ''
+        entries = _flat_parameter_index(state).direct_children.get(prefix, ())
+        return {name: parameters[path] for path, name in entries}
 
     @property
     def parameter_types(self) -> Dict[str, Any]:
@@ -155,9 +242,22 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         Uses self.object_instance (target object for this PFM's scope), NOT self.state.object_instance (root).
         Filters by self.parameters keys (already scoped/stripped for nested PFMs).
         """
-        from python_introspect import UnifiedParameterAnalyzer
-        param_info_dict = UnifiedParameterAnalyzer.analyze(self.object_instance)
-        return {name: info.param_type for name, info in param_info_dict.items() if name in self.parameters}
+        param_info_dict = self._analyze_object_instance()
+        parameters = self.parameters
+        return {name: info.param_type for name, info in param_info_dict.items() if name in parameters}
+
+    def _analyze_object_instance(self) -> Dict[str, Any]:
+        """UnifiedParameterAnalyzer result for object_instance, re-run only when it is replaced.
+
+        Parameter types come from the object's declaration, so they cannot change while
+        the instance stays the same. Values are never cached here: ObjectState restore
+        and time travel rewrite them without a notification this view could key on.
+        """
+        obj = self.object_instance
+        cached = self._analysis_cache
+        if cached is None or cached[0] is not obj:
+            cached = self._analysis_cache = (obj, _analyze_target(obj))
+        return cached[1]
 
     @property
     def param_defaults(self) -> Dict[str, Any]:
@@ -166,9 +266,22 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         Uses self.object_instance (target object for this PFM's scope), NOT self.state.object_instance (root).
         Uses self.parameters keys (already scoped/stripped for nested PFMs).
         """
-        return {name: object.__getattribute__(self.object_instance, name)
-                for name in self.parameters.keys()
-                if hasattr(self.object_instance, name)}
+        obj = self.object_instance
+        names = self.parameters.keys()
+        inst_dict = getattr(obj, '__dict__', None)
+        if inst_dict is None:
+            # Slotted object: no instance dict to read from
+            return {name: object.__getattribute__(obj, name)
+                    for name in names if hasattr(obj, name)}
+        # Dataclass fields live in the instance dict; only class-level
+        # attributes (properties, slots, class defaults) need the slow lookup
+        defaults = {}
+        for name in names:
+            if name in inst_dict:
+                defaults[name] = inst_dict[name]
+            elif hasattr(obj, name):
+                defaults[name] = object.__getattribute__(obj, name)
+        return defaults
 
     @property
     def _parameter_descriptions(self) -> Dict[str, str]:
@@ -188,14 +301,13 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
                    Created by lifecycle owner or looked up from ObjectStateRegistry.
             config: Optional configuration object for UI settings
         """
-        # Import here to avoid circular dependency
-        from objectstate import ObjectState
-
         # Unpack config or use defaults
         config = config or FormManagerConfig()
 
         # Store field_prefix EARLY - needed for target_obj navigation
         self.field_prefix = config.field_prefix
+        # Prepended to param names to form dotted state paths ('' at the root)
+        self._prefix_dot = f'{self.field_prefix}.' if self.field_prefix else ''
 
         # For nested PFMs, navigate to the nested object using field_prefix
         # Root PFM: Use extraction_target (handles __objectstate_delegate__ correctly)
@@ -205,8 +317,7 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         # _extraction_target is the editable config object (e.g., PipelineConfig)
         target_obj = state._extraction_target
         if self.field_prefix:
-            for part in self.field_prefix.split('.'):
-                target_obj = getattr(target_obj, part)
+            target_obj = _prefix_getter(self.field_prefix)(target_obj)
 
         # Derive field_id from the TARGET object type (nested type for nested PFMs)
         derived_field_id = type(target_obj).__name__
@@ -220,11 +331,15 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
             # Store target object for this PFM's scope (root or nested)
             # CRITICAL: Nested PFMs need their own object_instance for type conversions, etc.
             self.object_instance = target_obj
+            self._analysis_cache = None  # (object_instance, UnifiedParameterAnalyzer result)
             self.field_id = derived_field_id  # Derived from target type
             self.context_obj = state.context_obj
             self.scope_id = state.scope_id
             self.read_only = config.read_only
             self._parent_manager = config.parent_manager
+            # Root flag and root of the manager tree, resolved once (managers are never reparented)
+            self._is_root = self._parent_manager is None
+            self._root_manager = self if self._is_root else self._parent_manager._root_manager
 
             # Track completion callbacks for async widget creation
             self._on_build_complete_callbacks = []
@@ -235,18 +350,10 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
             # STEP 2: Build UI config (still needed for widget creation)
             with timer("  Build config", threshold_ms=5.0):
-                from pyqt_formgen.forms.parameter_form_service import ParameterFormService
-                from pyqt_formgen.forms.form_init_service import (
-                    ExtractedParameters, ConfigBuilderService
-                )
-
                 self.service = ParameterFormService()
                 # Single code path for all object types - that's the point of UnifiedParameterAnalyzer
-                from python_introspect import UnifiedParameterAnalyzer
-
-                param_info_dict = UnifiedParameterAnalyzer.analyze(target_obj)
-                # self.parameters property already filters/strips keys for our prefix
-                derived_param_types = {name: info.param_type for name, info in param_info_dict.items() if name in self.parameters}
+                # Same cached analysis as the parameter_types property
+                derived_param_types = self.parameter_types
 
                 # Access state data directly - ObjectState is single source of truth
                 # Pass the scoped parameters and the target object for nested PFMs
@@ -265,17 +372,28 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
             # STEP 3: Initialize VIEW-only attributes
             self.widgets, self.reset_buttons, self.nested_managers = {}, {}, {}
             self.labels = {}  # Track LabelWithHelp widgets for bold styling
-            self._pending_nested_managers: Dict[str, 'ParameterFormManager'] = {}
+            self._dotted_paths: Dict[str, str] = {}  # param_name -> state path, filled as widgets are built
+            self._pending_nested_managers: Dict[Tuple[str, str], 'ParameterFormManager'] = {}
+            self._pending_key: Optional[Tuple[str, str]] = None  # Our key in the root's pending dict
+            # Root only: field_prefix -> nested manager for every manager in the tree
+            self._prefix_to_manager: Dict[str, 'ParameterFormManager'] = {}
+            self._extra_repaint_callbacks: List[Callable[[], None]] = []  # See register_repaint_callback
 
             # STEP 4: VIEW-only flags (state tracking is in ObjectState)
             self._initial_load_complete, self._block_cross_window_updates, self._in_reset = False, False, False
             self._dispatching = False
+            self._suppress_refresh = False  # True while a bulk reset defers its placeholder refresh
+            # Root only: state callbacks arriving while the form is hidden (including before
+            # it is first shown) are recorded here and applied once on the next showEvent
+            self._pending_state_change = False
+            self._pending_visual_update = False
+            self._pending_resolved_paths: Set[str] = set()
+            self._pending_widget_paths: Set[str] = set()
             self.shared_reset_fields = set()  # VIEW-only: tracks field paths for cross-window reset styling
 
             # CROSS-WINDOW: Connect to change notifications (only root managers)
             # Nested managers are internal to their window and should not participate in cross-window updates
             if self._parent_manager is None:
-                from objectstate import ObjectStateRegistry
                 ObjectStateRegistry.connect_listener(self._on_live_context_changed)
                 # Invalidate cache so newly opened windows build fresh snapshots
                 ObjectStateRegistry.increment_token(notify=False)
@@ -296,7 +414,6 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
             # STEP 5: Initialize services (metaprogrammed service + auto-unpack)
             with timer("  Initialize services", threshold_ms=1.0):
-                from pyqt_formgen.forms.form_init_service import ServiceFactoryService
                 services = ServiceFactoryService.build()
                 # METAPROGRAMMING: Auto-unpack all services to self with _ prefix
                 ValueCollectionService.unpack_to_self(self, services, prefix="_")
@@ -329,8 +446,13 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
                 # TODO: Remove this after all callers are updated to use context manager
                 SignalService.register_cross_window_signals(self)
 
-            # Debounce timer for cross-window placeholder refresh
+            # Debounce timer for cross-window placeholder refresh (created on first use).
+            # Pending targeted fields and any bulk request accumulate until it fires.
             self._cross_window_refresh_timer = None
+            self._pending_refresh_fields: Dict[str, bool] = {}  # field -> emit context_changed
+            self._pending_bulk_refresh: Optional[bool] = None  # None: no bulk pending, else emit flag
+            # Coalescing timer for resolved-value flashes (root only, created on first change)
+            self._resolved_flush_timer = None
 
             # Flash animation: Subscribe to resolved value changes (root only)
             # NOTE: _init_visual_update_mixin() is called earlier (before setup_ui)
@@ -366,10 +488,13 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
     def setup_ui(self):
         """Set up the UI layout."""
-        # timer decorator made optional
-
-        is_nested = self._parent_manager is not None
+        if self._parent_manager is None:
+            self._setup_ui_root()
+        else:
+            self._setup_ui_nested()
 
+    def _setup_ui_root(self) -> None:
+        # timer decorator made optional
         with timer("    Layout setup", threshold_ms=1.0):
             layout = QVBoxLayout(self)
             layout.setSpacing(CURRENT_LAYOUT.main_layout_spacing)
@@ -377,18 +502,14 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
         # Always apply styling
         with timer("    Style generation", threshold_ms=1.0):
-            from pyqt_formgen.theming.style_generator import StyleSheetGenerator
-            style_gen = StyleSheetGenerator(self.color_scheme)
-            self.setStyleSheet(style_gen.generate_config_window_style())
+            self.setStyleSheet(_config_window_style(self.color_scheme))
 
         # Build form content
         with timer("    Build form", threshold_ms=5.0):
             form_widget = self.build_form()
 
-        # OPTIMIZATION: Never add scroll areas for nested configs
-        # This saves ~2ms per nested config × 20 configs = 40ms
         with timer("    Add scroll area", threshold_ms=1.0):
-            if self.config.use_scroll_area and not is_nested:
+            if self.config.use_scroll_area:
                 scroll_area = QScrollArea()
                 scroll_area.setWidgetResizable(True)
                 scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -398,6 +519,21 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
             else:
                 layout.addWidget(form_widget)
 
+    def _setup_ui_nested(self) -> None:
+        layout = QVBoxLayout(self)
+        layout.setSpacing(CURRENT_LAYOUT.main_layout_spacing)
+        layout.setContentsMargins(*CURRENT_LAYOUT.main_layout_margins)
+
+        # Always apply styling (cached per color scheme, so nested managers don't regenerate it)
+        self.setStyleSheet(_config_window_style(self.color_scheme))
+
+        with timer("    Build form", threshold_ms=5.0):
+            form_widget = self.build_form()
+
+        # OPTIMIZATION: Never add scroll areas for nested configs
+        # This saves ~2ms per nested config × 20 configs = 40ms
+        layout.addWidget(form_widget)
+
     def build_form(self) -> QWidget:
         """Build form UI using orchestrator service."""
         # timer decorator made optional
@@ -417,7 +553,6 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
     def _create_widget_for_param(self, param_info: Any) -> Any:
         """Create widget for a parameter. Type auto-detected from param_info."""
-        from pyqt_formgen.forms.widget_creation_config import create_widget_parametric
         return create_widget_parametric(self, param_info)
 
     def _create_widgets_async(self, layout, param_infos, on_complete=None):
@@ -428,12 +563,15 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
             param_infos: List of parameter info objects
             on_complete: Optional callback to run when all widgets are created
         """
-        # Create widgets in batches using QTimer to yield to event loop
-        batch_size = 3  # Create 3 widgets at a time
+        # Create widgets in batches using QTimer to yield to event loop.
+        # Batch size is rescaled after each batch so a tick costs about ASYNC_BATCH_BUDGET_MS
+        batch_size = self.ASYNC_BATCH_SIZE
+        budget_ms = self.ASYNC_BATCH_BUDGET_MS
+        create_widget = self._create_widget_for_param
         index = 0
 
         def create_next_batch():
-            nonlocal index
+            nonlocal index, batch_size
 
             # Guard: Check if layout's parent widget was deleted (window closed during async build)
             try:
@@ -447,16 +585,19 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
                 return
 
             batch_end = min(index + batch_size, len(param_infos))
+            add_widget = layout.addWidget
+            start = time.perf_counter()
 
             for i in range(index, batch_end):
-                param_info = param_infos[i]
-                widget = self._create_widget_for_param(param_info)
+                widget = create_widget(param_infos[i])
                 try:
-                    layout.addWidget(widget)
+                    add_widget(widget)
                 except RuntimeError as e:
                     logger.warning(f"Async widget creation aborted during addWidget: {e}")
                     return
 
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            batch_size = max(2, int(batch_size * budget_ms / max(elapsed_ms, 0.5)))
             index = batch_end
 
             # Schedule next batch if there are more widgets
@@ -482,7 +623,7 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
             current_value: Ignored (kept for ABC compatibility)
         """
         # Build nested field_prefix
-        nested_prefix = f'{self.field_prefix}.{param_name}' if self.field_prefix else param_name
+        nested_prefix = self._prefix_dot + param_name
 
         # Create nested PFM (VIEW) that shares the same ObjectState (MODEL)
         nested_config = FormManagerConfig(
@@ -505,17 +646,16 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
         # Store nested manager
         self.nested_managers[param_name] = nested_manager
+        self._root_manager._prefix_to_manager[nested_manager.field_prefix] = nested_manager
 
         # Register with root manager for async completion tracking
         # Count parameters with nested_prefix
-        param_count = sum(1 for path in self.state.parameters.keys() if path.startswith(f'{nested_prefix}.'))
-        root_manager = self
-        while root_manager._parent_manager is not None:
-            root_manager = root_manager._parent_manager
+        param_count = _flat_parameter_index(self.state).descendant_counts.get(nested_prefix, 0)
+        root_manager = self._root_manager
 
         if self.should_use_async(param_count):
-            unique_key = f"{self.field_id}.{param_name}"
-            root_manager._pending_nested_managers[unique_key] = nested_manager
+            nested_manager._pending_key = (self.field_id, param_name)
+            root_manager._pending_nested_managers[nested_manager._pending_key] = nested_manager
 
         return nested_manager
 
@@ -547,23 +687,45 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         with timer(f"reset_all_parameters ({self.field_id})", threshold_ms=50.0):
             # PHASE 2A: Use FlagContextManager instead of manual flag management
             # This guarantees flags are restored even on exception
-            with FlagContextManager.reset_context(self, block_cross_window=True):
+            # One atomic block: a single time-travel snapshot (and undo step) for the whole reset
+            with self._batched_updates(), FlagContextManager.reset_context(self, block_cross_window=True), \
+                    ObjectStateRegistry.atomic(f"reset {self.field_prefix or self.field_id}"):
                 # CRITICAL: Iterate over form_structure.parameters instead of self.parameters
                 # form_structure only contains visible (non-hidden) parameters,
                 # while self.parameters may include ui_hidden parameters that don't have widgets
-                param_names = [param_info.name for param_info in self.form_structure.parameters]
+                parameters = self.parameters
+                param_names = [param_info.name for param_info in self.form_structure.parameters
+                               if param_info.name in parameters]
+                # Inlined reset_parameter: the flags are already set for the whole batch and
+                # the dispatcher would drop every event while _in_reset is True
+                reset_one = self._parameter_ops_service.reset_parameter
                 for param_name in param_names:
-                    # Call reset_parameter directly to avoid nested context managers
-                    self.reset_parameter(param_name)
-
-            # OPTIMIZATION: Single placeholder refresh at the end instead of per-parameter
-            # This is much faster than refreshing after each reset
-            # CRITICAL: Use refresh_with_live_context to build context stack from tree registry
-            # Even when resetting to defaults, we need live context for sibling inheritance
-            # REFACTORING: Inline delegate calls
-            self._parameter_ops_service.refresh_with_live_context(self)
+                    reset_one(self, param_name)
+
+                # Label styling once, after all fields have been reset
+                for param_name in param_names:
+                    self._update_label_styling(param_name)
+
+    @contextmanager
+    def _batched_updates(self):
+        """Defer placeholder refresh until the batch exits, then refresh this subtree once.
+
+        Nested managers reset as part of a parent's batch skip their own refresh:
+        the outermost batch's refresh_with_live_context already walks the whole subtree.
+        """
+        parent = self._parent_manager
+        deferred_to_parent = parent is not None and parent._suppress_refresh
+
+        with FlagContextManager.manage_flags(self, _suppress_refresh=True):
+            yield
 
+        if deferred_to_parent:
+            return
 
+        # OPTIMIZATION: Single placeholder refresh at the end instead of per-parameter
+        # CRITICAL: Use refresh_with_live_context to build context stack from tree registry
+        # Even when resetting to defaults, we need live context for sibling inheritance
+        self._parameter_ops_service.refresh_with_live_context(self)
 
     def update_parameter(self, param_name: str, value: Any) -> None:
         """Update parameter value using shared service layer.
@@ -578,17 +740,26 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
             value, self.parameter_types.get(param_name, type(value)), param_name, type(self.object_instance)
         )
 
+        # Build full dotted path for state update
+        dotted_path = self._prefix_dot + param_name
+
+        # Setting the current value is a no-op: skip widget sync, dispatch and styling
+        current = self.state.parameters.get(dotted_path, _MISSING)
+        if current is converted_value:
+            return
+        try:
+            if current is not _MISSING and bool(current == converted_value):
+                return
+        except (TypeError, ValueError):
+            pass  # No scalar equality (e.g. arrays): treat as changed
+
         # Update corresponding widget if it exists
         # ANTI-DUCK-TYPING: Skip widget update for nested containers (they don't implement ValueSettable)
         if param_name in self.widgets:
             widget = self.widgets[param_name]
-            from pyqt_formgen.protocols.widget_protocols import ValueSettable
             if isinstance(widget, ValueSettable):
                 self._widget_service.update_widget_value(widget, converted_value, param_name, False, self)
 
-        # Build full dotted path for state update
-        dotted_path = f'{self.field_prefix}.{param_name}' if self.field_prefix else param_name
-
         # Update state with full dotted path
         self.state.update_parameter(dotted_path, converted_value)
 
@@ -608,7 +779,7 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
             return
 
         # Build full dotted path for state update
-        dotted_path = f'{self.field_prefix}.{param_name}' if self.field_prefix else param_name
+        dotted_path = self._prefix_dot + param_name
 
         with FlagContextManager.reset_context(self, block_cross_window=False):
             self._parameter_ops_service.reset_parameter(self, param_name)
@@ -630,8 +801,7 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         if param_name not in self.labels:
             return
 
-        # Build full dotted path for state lookup
-        dotted_path = f'{self.field_prefix}.{param_name}' if self.field_prefix else param_name
+        dotted_path = self._dotted_paths[param_name]
         should_underline = dotted_path in self.state.signature_diff_fields
 
         label = self.labels[param_name]
@@ -641,13 +811,39 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         is_dirty = dotted_path in self.state.dirty_fields
         label.set_dirty_indicator(is_dirty)
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._flush_pending_state_callbacks()
+
+    def _flush_pending_state_callbacks(self) -> None:
+        """Apply state callbacks that fired while the form was hidden (no flashes)."""
+        if self._pending_widget_paths:
+            self._refresh_widgets_for_paths(self._pending_widget_paths)
+            self._pending_widget_paths = set()
+        if self._pending_resolved_paths:
+            self._refresh_placeholders_for_paths(self._pending_resolved_paths)
+            self._pending_resolved_paths = set()
+        if self._pending_state_change:
+            self._pending_state_change = False
+            self._on_state_changed()
+        if self._pending_visual_update:
+            self._pending_visual_update = False
+            self.queue_visual_update()
+
     def _on_state_changed(self) -> None:
         """Callback when materialized state changes (dirty/signature diff)."""
-        for param_name in self.labels:
-            self._update_label_styling(param_name)
-
-        for nested_manager in self.nested_managers.values():
-            nested_manager._on_state_changed()
+        if not self.isVisible():
+            self._pending_state_change = True
+            return
+        # The tree shares one ObjectState: read both field sets once, not per label
+        signature_diff_fields = self.state.signature_diff_fields
+        dirty_fields = self.state.dirty_fields
+        for manager in iter_manager_tree(self):
+            dotted_paths = manager._dotted_paths
+            for param_name, label in manager.labels.items():
+                dotted_path = dotted_paths[param_name]
+                label.set_underline(dotted_path in signature_diff_fields)
+                label.set_dirty_indicator(dotted_path in dirty_fields)
 
     def update_groupbox_dirty_markers(self, dirty_prefixes: set, sig_diff_prefixes: set = None) -> None:
         """Update groupbox titles with dirty markers and signature diff underline.
@@ -685,20 +881,25 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         for param_name, nested_manager in self.nested_managers.items():
             callback(param_name, nested_manager)
 
+    def _refresh_enabled_tree(self) -> None:
+        """Refresh enabled styling for all nested managers (not this one) without recursion."""
+        # Skipped managers (None optional dataclass) also skip their subtree
+        skipped = set()
+        for manager in iter_manager_tree(self, descend=lambda m: id(m) not in skipped):
+            if manager is not self and not manager._enabled_field_styling_service.refresh_own_enabled_styling(manager):
+                skipped.add(id(manager))
+
     def _apply_callbacks_recursively(self, callback_list_name: str) -> None:
-        """REFACTORING: Unified recursive callback application - eliminates duplicate methods.
+        """REFACTORING: Unified callback application over this manager and all nested managers.
 
         Args:
             callback_list_name: Name of the callback list attribute (e.g., '_on_build_complete_callbacks')
         """
-        callback_list = getattr(self, callback_list_name)
-        for callback in callback_list:
-            callback()
-        callback_list.clear()
-
-        # Recursively apply nested managers' callbacks
-        for nested_manager in self.nested_managers.values():
-            nested_manager._apply_callbacks_recursively(callback_list_name)
+        for manager in iter_manager_tree(self):
+            callback_list = getattr(manager, callback_list_name)
+            for callback in callback_list:
+                callback()
+            callback_list.clear()
 
     def _on_nested_manager_complete(self, nested_manager) -> None:
         """
@@ -706,15 +907,10 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
         ANTI-DUCK-TYPING: _pending_nested_managers always exists (set in __init__).
         """
-        # Find and remove this manager from pending dict
-        key_to_remove = None
-        for key, manager in self._pending_nested_managers.items():
-            if manager is nested_manager:
-                key_to_remove = key
-                break
-
-        if key_to_remove:
-            del self._pending_nested_managers[key_to_remove]
+        # Remove this manager from pending dict (only if it still owns its key)
+        key = nested_manager._pending_key
+        if key is not None and self._pending_nested_managers.get(key) is nested_manager:
+            del self._pending_nested_managers[key]
 
         # If all nested managers are done, delegate to orchestrator
         if len(self._pending_nested_managers) == 0:
@@ -740,6 +936,9 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         # Skip if this form triggered the change
         if getattr(self, '_block_cross_window_updates', False):
             return
+        if not self.isVisible():
+            self._pending_visual_update = True  # Hidden form: update once on show
+            return
         # PERFORMANCE FIX: Don't do full tree refresh on every cross-window change.
         # The ObjectState already has correct values - we only need to update
         # placeholder TEXT display, which can wait for next explicit refresh.
@@ -751,7 +950,6 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
     def unregister_from_cross_window_updates(self):
         """Unregister from cross-window updates."""
         try:
-            from objectstate import ObjectStateRegistry
             ObjectStateRegistry.disconnect_listener(self._on_live_context_changed)
 
             # CRITICAL: Unregister resolved value change callback to prevent memory leak
@@ -785,56 +983,72 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
                         Set to False when refresh is triggered by another window's
                         context_refreshed to prevent infinite ping-pong loops.
         """
-        # Cancel existing timer if any
-        if self._cross_window_refresh_timer is not None:
-            self._cross_window_refresh_timer.stop()
+        # Requests accumulate until the timer fires; each keeps its own emit flag so a
+        # field received from another window (emit_signal=False) is never re-broadcast
+        if changed_field is None:
+            self._pending_bulk_refresh = bool(self._pending_bulk_refresh) or emit_signal
+        else:
+            pending = self._pending_refresh_fields
+            pending[changed_field] = pending.get(changed_field, False) or emit_signal
+
+        # Restart the debounce on the one reusable timer
+        timer = self._cross_window_refresh_timer
+        if timer is None:
+            timer = self._cross_window_refresh_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(self._do_cross_window_refresh)
+        timer.start(50)  # 50ms debounce
+
+    def _do_cross_window_refresh(self) -> None:
+        """Run the refresh scheduled by _schedule_cross_window_refresh."""
+        # Check if this manager was deleted before the timer fired
+        try:
+            from PyQt6 import sip
+            if sip.isdeleted(self):
+                return
+        except (ImportError, TypeError):
+            pass
+        changed_fields, self._pending_refresh_fields = self._pending_refresh_fields, {}
+        bulk_emit, self._pending_bulk_refresh = self._pending_bulk_refresh, None
+        if bulk_emit is not None:
+            # Bulk refresh: refresh all placeholders (save/cancel/code editor)
+            # It covers every accumulated targeted field as well
+            self._parameter_ops_service.refresh_with_live_context(self)
+            self._refresh_enabled_tree()
+        elif changed_fields:
+            # Targeted refresh: only the fields that changed, in one walk over
+            # this manager and its nested managers
+            self._refresh_fields_in_tree(set(changed_fields))
+        else:
+            return
 
-        def do_refresh():
-            # Check if this manager was deleted before the timer fired
-            try:
-                from PyQt6 import sip
-                if sip.isdeleted(self):
-                    return
-            except (ImportError, TypeError):
-                pass
-            if changed_field is not None:
-                # Targeted refresh: only refresh the specific field that changed
-                # This field might exist in this manager OR in nested managers
-                self._refresh_field_in_tree(changed_field)
-            else:
-                # Bulk refresh: refresh all placeholders (save/cancel/code editor)
-                self._parameter_ops_service.refresh_with_live_context(self)
-                self._apply_to_nested_managers(lambda _, manager: manager._enabled_field_styling_service.refresh_enabled_styling(manager))
-
-            # CRITICAL: Only root managers emit signals to avoid nested ping-pong
-            if emit_signal and self._parent_manager is None:
-                self.context_changed.emit(self.scope_id or "", changed_field or "")
-
-        self._cross_window_refresh_timer = QTimer()
-        self._cross_window_refresh_timer.setSingleShot(True)
-        self._cross_window_refresh_timer.timeout.connect(do_refresh)
-        self._cross_window_refresh_timer.start(50)  # 10ms debounce
-
-    def _refresh_field_in_tree(self, field_name: str):
-        """Refresh a field's placeholder in this manager and nested managers."""
-        if field_name in self.widgets:
-            self._parameter_ops_service.refresh_single_placeholder(self, field_name)
-        for nested_manager in self.nested_managers.values():
-            nested_manager._refresh_field_in_tree(field_name)
+        # CRITICAL: Only root managers emit signals to avoid nested ping-pong
+        if self._parent_manager is None:
+            scope_id = self.scope_id or ""
+            if bulk_emit:
+                self.context_changed.emit(scope_id, "")
+            for changed_field, emit_signal in changed_fields.items():
+                if emit_signal:
+                    self.context_changed.emit(scope_id, changed_field)
+
+    def _refresh_fields_in_tree(self, field_names: Set[str]) -> None:
+        """Refresh several fields' placeholders in one walk over this manager tree."""
+        for manager in iter_manager_tree(self):
+            refresh = manager._parameter_ops_service.refresh_single_placeholder
+            for field_name in field_names & manager.widgets.keys():
+                refresh(manager, field_name)
 
     def refresh_widgets_from_state(self):
         """Refresh all widget values from state.parameters.
 
         Called during time-travel to sync Qt widgets with restored ObjectState.
         """
-        from pyqt_formgen.protocols.widget_protocols import ValueSettable
 
+        parameters = self.state.parameters
         for param_name, widget in self.widgets.items():
             if isinstance(widget, ValueSettable):
-                # Build full dotted path
-                dotted_path = f'{self.field_prefix}.{param_name}' if self.field_prefix else param_name
-                value = self.state.parameters.get(dotted_path)
-                if value is not None:
+                value = parameters.get(self._dotted_paths[param_name])
+                if value is not None and not self._widget_shows_value(widget, value):
                     self._widget_service.update_widget_value(widget, value, param_name, False, self)
 
         # Recurse into nested managers
@@ -859,7 +1073,12 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         if self._parent_manager is not None:
             return  # Only root manager handles this
 
-        from objectstate import ObjectStateRegistry
+        if not self.isVisible():
+            # Hidden: nothing to flash, refresh once on the next show
+            if ObjectStateRegistry._in_time_travel:
+                self._pending_widget_paths |= changed_paths
+            self._pending_resolved_paths |= changed_paths
+            return
 
         logger.debug(f"🔔 CALLBACK_LEAK_DEBUG: _on_resolved_values_changed invoked for {self.field_id}, "
                    f"changed_paths={changed_paths}")
@@ -867,24 +1086,52 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
         # TIME-TRAVEL: Refresh widget values for changed paths
         # (during time-travel, user didn't type - widgets need to be updated from state)
+        # Done now: the time-travel flag is only set while this callback runs
         if ObjectStateRegistry._in_time_travel:
             self._refresh_widgets_for_paths(changed_paths)
 
+        # Flashes and placeholder refreshes for a burst of changes run once, on the next flush
+        self._pending_resolved_paths |= changed_paths
+        timer = self._resolved_flush_timer
+        if timer is None:
+            timer = self._resolved_flush_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(self._flush_resolved_changes)
+        if not timer.isActive():
+            timer.start(self.RESOLVED_FLUSH_MS)
+
+    def _flush_resolved_changes(self) -> None:
+        """Queue leaf flashes and refresh placeholders for all coalesced resolved changes."""
+        paths, self._pending_resolved_paths = self._pending_resolved_paths, set()
+
         # For each changed path, register and queue a LEAF flash
-        for path in changed_paths:
+        for path in paths:
             self._queue_leaf_flash_for_path(path)
 
         # Refresh placeholders for changed fields (show new resolved values)
-        for path in changed_paths:
-            leaf_field = path.split('.')[-1] if '.' in path else path
-            self._refresh_field_in_tree(leaf_field)
+        self._refresh_placeholders_for_paths(paths)
+
+    def _refresh_placeholders_for_paths(self, paths: Set[str]) -> None:
+        # Placeholders are refreshed by leaf name across the tree, so each name once
+        self._refresh_fields_in_tree({path.rpartition('.')[2] for path in paths})
+
+    def _widget_shows_value(self, widget: QWidget, value: Any) -> bool:
+        """Whether widget already holds value, so writing it again would only repaint."""
+        if value is None:
+            return False  # None re-resolves the placeholder, always apply it
+        current = self._widget_service.get_widget_value(widget)
+        if type(current) is not type(value):
+            return False
+        try:
+            return bool(current == value)
+        except (TypeError, ValueError):
+            return False
 
     def _refresh_widgets_for_paths(self, paths: Set[str]):
         """Refresh widget values for specific paths from state.parameters.
 
         Used during time-travel to sync Qt widgets with restored ObjectState.
         """
-        from pyqt_formgen.protocols.widget_protocols import ValueSettable
 
         logger.debug(f"⏱️ WIDGET_REFRESH: paths={paths}, field_prefix={self.field_prefix!r}, widgets={list(self.widgets.keys())}")
 
@@ -911,10 +1158,9 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
                 widget = self.widgets[leaf_field]
                 if isinstance(widget, ValueSettable):
                     # Use get with sentinel to distinguish "key exists with None value" from "key doesn't exist"
-                    _MISSING = object()
                     value = self.state.parameters.get(path, _MISSING)
                     logger.debug(f"⏱️ WIDGET_REFRESH: UPDATING {leaf_field} -> {value!r}")
-                    if value is not _MISSING:
+                    if value is not _MISSING and not self._widget_shows_value(widget, value):
                         # None is a valid value (means "inherit") - don't skip it
                         self._widget_service.update_widget_value(widget, value, leaf_field, False, self)
             else:
@@ -971,60 +1217,31 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         logger.debug(f"[FLASH] Queued leaf flash: key={leaf_flash_key}, tree_key={prefix}, leaf={leaf_field}")
 
     def _find_nested_manager_for_prefix(self, prefix: str) -> Optional['ParameterFormManager']:
-        """Find the nested manager for a given field_prefix."""
-        return self._find_nested_manager_recursive(prefix, self)
-
-    def _find_nested_manager_recursive(self, prefix: str, manager: 'ParameterFormManager') -> Optional['ParameterFormManager']:
-        """Recursively find nested manager with matching prefix."""
-        for _, nested_manager in manager.nested_managers.items():
-            if nested_manager.field_prefix == prefix:
-                return nested_manager
-            result = self._find_nested_manager_recursive(prefix, nested_manager)
-            if result:
-                return result
-        return None
+        """Find the nested manager for a given field_prefix (root manager only)."""
+        return self._prefix_to_manager.get(prefix)
 
     def _find_matching_prefix(self, path: str) -> Optional[str]:
-        """Find the nested manager field_prefix that matches a changed path."""
-        return self._find_prefix_recursive(path, self)
-
-    def _find_prefix_recursive(self, path: str, manager: 'ParameterFormManager') -> Optional[str]:
-        """Recursively find matching prefix through nested managers."""
-        for _, nested_manager in manager.nested_managers.items():
-            prefix = nested_manager.field_prefix
-            if path.startswith(prefix + '.') or path == prefix:
-                deeper = self._find_prefix_recursive(path, nested_manager)
-                return deeper if deeper else prefix
+        """Find the deepest nested manager field_prefix that matches a changed path (root manager only)."""
+        prefixes = self._prefix_to_manager
+        while path:
+            if path in prefixes:
+                return path
+            path = path.rpartition('.')[0]
         return None
 
     # PAINT-TIME API: get_flash_color_for_key() inherited from VisualUpdateMixin
     # Groupboxes and tree items call this during paint to get current flash color
 
-    # PERFORMANCE: Cache groupbox lookups - structure doesn't change after form creation
-    _groupbox_cache: Dict[str, Optional[QWidget]]
-
     def _get_groupbox_for_prefix(self, prefix: str) -> Optional[QWidget]:
-        """Get the groupbox widget for a field_prefix by finding the nested manager.
+        """Get the groupbox widget for a field_prefix (root manager only).
 
-        PERFORMANCE: Results are cached since form structure is immutable.
+        The groupbox is the nested manager's container, stored in its parent's
+        widgets under the last prefix segment.
         """
-        if not hasattr(self, '_groupbox_cache'):
-            self._groupbox_cache = {}
-        if prefix in self._groupbox_cache:
-            return self._groupbox_cache[prefix]
-        result = self._get_groupbox_recursive(prefix, self)
-        self._groupbox_cache[prefix] = result
-        return result
-
-    def _get_groupbox_recursive(self, prefix: str, manager: 'ParameterFormManager') -> Optional[QWidget]:
-        """Recursively find groupbox by prefix."""
-        for param_name, nested_manager in manager.nested_managers.items():
-            if nested_manager.field_prefix == prefix:
-                return manager.widgets.get(param_name)
-            result = self._get_groupbox_recursive(prefix, nested_manager)
-            if result:
-                return result
-        return None
+        nested_manager = self._prefix_to_manager.get(prefix)
+        if nested_manager is None:
+            return None
+        return nested_manager._parent_manager.widgets.get(prefix.rpartition('.')[2])
 
     def _is_flash_visible(self) -> bool:
         """Check if this form's flash animations are visible on screen.
@@ -1053,7 +1270,7 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
         This method is now a no-op - the global coordinator handles all repaints.
         """
         # Repaint callbacks for external widgets (e.g., tree widget)
-        for callback in getattr(self, '_extra_repaint_callbacks', []):
+        for callback in self._extra_repaint_callbacks:
             callback()
 
     def register_repaint_callback(self, callback) -> None:
@@ -1061,6 +1278,4 @@ class ParameterFormManager(QWidget, ParameterFormManagerABC, FlashMixin, metacla
 
         Used by ConfigWindow to repaint tree widget using same flash source of truth.
         """
-        if not hasattr(self, '_extra_repaint_callbacks'):
-            self._extra_repaint_callbacks = []
         self._extra_repaint_callbacks.append(callback)
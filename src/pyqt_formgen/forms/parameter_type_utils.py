@@ -6,12 +6,26 @@ code duplication between PyQt and Textual parameter form implementations.
 """
 
 import dataclasses
+import functools
 from typing import Dict, Optional, Type, Union, get_origin, get_args
 from enum import Enum
 
 from pyqt_formgen.forms.parameter_form_constants import CONSTANTS
 
 
+def _memoize_by_type(func):
+    """Cache a single-argument type predicate; unhashable arguments bypass the cache."""
+    cached = functools.lru_cache(maxsize=512)(func)
+
+    @functools.wraps(func)
+    def wrapper(param_type):
+        try:
+            return cached(param_type)
+        except TypeError:
+            return func(param_type)
+    return wrapper
+
+
 class ParameterTypeUtils:
     """
     Utility class for parameter type checking and resolution.
@@ -174,6 +188,7 @@ class ParameterTypeUtils:
         return param_type
     
     @staticmethod
+    @_memoize_by_type
     def is_enum_type(param_type: Type) -> bool:
         """
         Check if a type is an Enum type.
@@ -188,6 +203,7 @@ class ParameterTypeUtils:
                 Enum in getattr(param_type, CONSTANTS.BASES_ATTR))
     
     @staticmethod
+    @_memoize_by_type
     def is_list_of_enums(param_type: Type) -> bool:
         """
         Check if parameter type is List[Enum].
@@ -212,6 +228,7 @@ class ParameterTypeUtils:
             return False
     
     @staticmethod
+    @_memoize_by_type
     def get_enum_from_list_type(param_type: Type) -> Optional[Type]:
         """
         Extract enum type from List[Enum] type.
@@ -24,6 +24,7 @@ from .widget_creation_types import (
 )
 from pyqt_formgen.services.field_change_dispatcher import FieldChangeDispatcher, FieldChangeEvent
 from pyqt_formgen.services.widget_service import WidgetService
+from pyqt_formgen.forms.layout_constants import CURRENT_LAYOUT
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +100,6 @@ def _create_optional_title_widget(manager, param_info, display_info, field_ids,
     from PyQt6.QtGui import QFont
     from pyqt_formgen.widgets.no_scroll_spinbox import NoneAwareCheckBox
     from pyqt_formgen.widgets.shared.clickable_help_components import HelpButton
-    from pyqt_formgen.forms.layout_constants import CURRENT_LAYOUT
 
     title_widget = QWidget()
     title_layout = QHBoxLayout(title_widget)
@@ -352,7 +352,6 @@ def create_widget_parametric(manager: ParameterFormManager, param_info: Paramete
     from pyqt_formgen.widgets.shared.clickable_help_components import GroupBoxWithHelp, LabelWithHelp
     from pyqt_formgen.forms.widget_strategies import PyQt6WidgetEnhancer
     from pyqt_formgen.theming.color_scheme import ColorScheme as PyQt6ColorScheme
-    from pyqt_formgen.forms.layout_constants import CURRENT_LAYOUT
     import logging
 
     logger = logging.getLogger(__name__)
@@ -371,6 +370,8 @@ def create_widget_parametric(manager: ParameterFormManager, param_info: Paramete
     field_ids = manager.service.generate_field_ids_direct(manager.config.field_id, param_info.name)
     current_value = manager.parameters.get(param_info.name)
     unwrapped_type = _unwrap_optional_type(param_info.type) if config.needs_unwrap_type else None
+    # Full state path, recorded once for the manager's per-field lookups
+    dotted_path = manager._dotted_paths[param_info.name] = manager._prefix_dot + param_info.name
 
     # Execute operations
     container = ops['create_container'](
@@ -421,9 +422,6 @@ def create_widget_parametric(manager: ParameterFormManager, param_info: Paramete
 
     # Add label if needed (REGULAR only)
     if config.needs_label:
-        # Compute dotted_path for provenance lookup
-        dotted_path = f'{manager.field_prefix}.{param_info.name}' if manager.field_prefix else param_info.name
-
         label = LabelWithHelp(
             text=display_info['field_label'],
             param_name=param_info.name,
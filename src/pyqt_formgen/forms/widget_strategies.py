@@ -17,14 +17,13 @@ from pyqt_formgen.widgets import (
 from pyqt_formgen.widgets.enhanced_path_widget import EnhancedPathWidget
 from pyqt_formgen.theming.color_scheme import ColorScheme as PyQt6ColorScheme
 from pyqt_formgen.forms.widget_creation_registry import resolve_optional, is_enum, is_list_of_enums, get_enum_from_list
-from contextlib import contextmanager
+from contextlib import nullcontext
 
 try:
     from pyqt_formgen.core.performance_monitor import timer
 except Exception:  # pragma: no cover - optional performance monitoring
-    @contextmanager
     def timer(*args, **kwargs):
-        yield
+        return nullcontext()
 
 logger = logging.getLogger(__name__)
 
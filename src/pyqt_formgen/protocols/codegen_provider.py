@@ -51,6 +51,10 @@ def register_codegen_provider(provider: CodegenProvider) -> None:
     global _codegen_provider
     _codegen_provider = provider
 
+    # Drop the delegation layer's cached provider (lazy: core imports protocols)
+    from pyqt_formgen.core.code_generator import invalidate_codegen_provider_cache
+    invalidate_codegen_provider_cache()
+
 
 def get_codegen_provider() -> Optional[CodegenProvider]:
     """Get the registered code generation provider."""
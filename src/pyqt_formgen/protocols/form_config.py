@@ -46,6 +46,10 @@ def set_form_config(config: FormGenConfig) -> None:
     global _form_config
     _form_config = config
 
+    # Log utilities cache config-derived paths/prefixes (lazy: core imports protocols)
+    from pyqt_formgen.core.log_utils import reset_log_config_cache
+    reset_log_config_cache()
+
 
 def get_form_config() -> FormGenConfig:
     """Get the current form generation configuration.
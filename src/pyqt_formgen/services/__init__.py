@@ -18,7 +18,7 @@ from .pattern_data_manager import PatternDataManager
 from .system_monitor_core import SystemMonitorCore
 from .persistent_system_monitor import PersistentSystemMonitor
 
-# Also export as modules for form_init_service's ServiceRegistryMeta
+# Also export as modules (form_init_service builds ManagerServices from these)
 from . import signal_service
 from . import widget_service
 from . import value_collection_service
@@ -72,9 +72,27 @@ class EnabledFieldStylingService:
         Args:
             manager: ParameterFormManager instance
         """
+        if not self.refresh_own_enabled_styling(manager):
+            return
+        
+        # Recursively refresh all nested forms' enabled styling
+        for nested_manager in manager.nested_managers.values():
+            self.refresh_enabled_styling(nested_manager)
+    
+    def refresh_own_enabled_styling(self, manager) -> bool:
+        """
+        Refresh enabled styling for this form only, without visiting nested forms.
+        
+        Args:
+            manager: ParameterFormManager instance
+        
+        Returns:
+            False if the form was skipped (optional dataclass with None instance),
+            in which case its nested forms should be skipped too
+        """
         # Check if this is a nested manager inside an optional dataclass with None instance
         if self._should_skip_optional_dataclass_styling(manager, "REFRESH ENABLED STYLING"):
-            return
+            return False
         
         # Refresh this form's enabled styling if it has an enabled field
         if 'enabled' in manager.parameters:
@@ -91,10 +109,7 @@ class EnabledFieldStylingService:
             
             # Apply styling with the resolved value
             self.on_enabled_field_changed(manager, 'enabled', resolved_value)
-        
-        # Recursively refresh all nested forms' enabled styling
-        for nested_manager in manager.nested_managers.values():
-            self.refresh_enabled_styling(nested_manager)
+        return True
     
     def on_enabled_field_changed(self, manager, param_name: str, value: Any) -> None:
         """
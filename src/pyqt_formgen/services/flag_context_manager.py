@@ -48,6 +48,7 @@ class ManagerFlag(Enum):
     IN_RESET = '_in_reset'
     BLOCK_CROSS_WINDOW = '_block_cross_window_updates'
     INITIAL_LOAD_COMPLETE = '_initial_load_complete'
+    SUPPRESS_REFRESH = '_suppress_refresh'
 
 
 class FlagContextManager:
@@ -14,6 +14,8 @@ Key features:
 from __future__ import annotations
 from typing import Any, Optional, Dict, TYPE_CHECKING
 from dataclasses import fields as dataclass_fields
+import functools
+import keyword
 import logging
 
 from .parameter_service_abc import ParameterServiceABC
@@ -28,6 +30,31 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _make_unpacker(source_type: type, prefix: str, field_mapping: tuple):
+    """Generate a straight-line ``target.x = source.x`` copier for one dataclass type.
+
+    field_mapping is the {target_name: source_name} mapping as item
+    pairs so it can key the cache.
+    """
+    renames = {}
+    for tgt_name, src_name in field_mapping:
+        renames.setdefault(src_name, tgt_name)  # first mapping wins, as before
+    pairs = [(renames.get(f.name, f"{prefix}{f.name}"), f.name)
+             for f in dataclass_fields(source_type)]
+
+    if not all(tgt.isidentifier() and not keyword.iskeyword(tgt) for tgt, _ in pairs):
+        def unpack(target, source):
+            for tgt_name, src_name in pairs:
+                setattr(target, tgt_name, getattr(source, src_name))
+        return unpack
+
+    body = "\n".join(f"    target.{tgt} = source.{src}" for tgt, src in pairs) or "    pass"
+    namespace: Dict[str, Any] = {}
+    exec(f"def unpack(target, source):\n{body}\n", namespace)
+    return namespace['unpack']
+
+
 class ValueCollectionService(ParameterServiceABC):
     """
     Consolidated service for value collection and unpacking.
@@ -144,10 +171,5 @@ class ValueCollectionService(ParameterServiceABC):
             field_mapping: Optional {target_name: source_name} mapping
             prefix: Optional prefix for target attribute names
         """
-        for field in dataclass_fields(source):
-            src_name = field.name
-            tgt_name = next(
-                (k for k, v in (field_mapping or {}).items() if v == src_name),
-                f"{prefix}{src_name}"
-            )
-            setattr(target, tgt_name, getattr(source, src_name))
+        mapping = tuple(field_mapping.items()) if field_mapping else ()
+        _make_unpacker(type(source), prefix, mapping)(target, source)
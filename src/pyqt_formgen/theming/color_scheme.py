@@ -6,6 +6,7 @@ all GUI components. Provides centralized color management with theme support,
 JSON configuration, and WCAG accessibility compliance.
 """
 
+import functools
 import logging
 from dataclasses import dataclass
 from typing import Tuple, Dict
@@ -15,6 +16,13 @@ from PyQt6.QtGui import QColor
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _rgb_to_hex(color_tuple: Tuple[int, int, int]) -> str:
+    """Format an RGB tuple as #rrggbb (memoized: schemes reuse a small palette)."""
+    r, g, b = color_tuple
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 @dataclass
 class ColorScheme:
     """
@@ -169,8 +177,11 @@ class ColorScheme:
         Returns:
             str: Hex color string (e.g., "#ff0000")
         """
-        r, g, b = color_tuple
-        return f"#{r:02x}{g:02x}{b:02x}"
+        try:
+            return _rgb_to_hex(color_tuple)
+        except TypeError:
+            # Unhashable sequence (e.g. a list loaded from JSON)
+            return _rgb_to_hex(tuple(color_tuple))
 
     @classmethod
     def create_dark_theme(cls) -> 'PyQt6ColorScheme':
@@ -778,7 +778,7 @@ class QScintillaCodeEditorDialog(QDialog):
             try:
                 selected_path = Path(file_path)
                 # Cache the parent directory for future dialogs
-                cache_dialog_path(PathCacheKey.CODE_EDITOR, selected_path.parent)
+                cache_dialog_path(PathCacheKey.CODE_EDITOR, selected_path.parent, verify=False)
 
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -806,7 +806,7 @@ class QScintillaCodeEditorDialog(QDialog):
                     file_path = str(selected_path)
 
                 # Cache the parent directory for future dialogs
-                cache_dialog_path(PathCacheKey.CODE_EDITOR, selected_path.parent)
+                cache_dialog_path(PathCacheKey.CODE_EDITOR, selected_path.parent, verify=False)
 
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(self.editor.text())
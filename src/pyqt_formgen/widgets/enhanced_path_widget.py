@@ -279,7 +279,7 @@ class EnhancedPathWidget(QWidget):
 
                 # Cache the selection (directory for files, path itself for directories)
                 cache_path = path_obj.parent if path_obj.is_file() else path_obj
-                cache_dialog_path(self.behavior.cache_key, cache_path)
+                cache_dialog_path(self.behavior.cache_key, cache_path, verify=False)
 
         except Exception as e:
             logger.error(f"Failed to open dialog: {e}")
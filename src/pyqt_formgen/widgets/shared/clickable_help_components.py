@@ -613,6 +613,7 @@ class LabelWithHelp(QWidget):
         # Main label - ProvenanceLabel for click-to-source support
         self._base_text = text  # Store base text for dirty indicator toggle
         self._is_dirty = False  # Track dirty state for indicator
+        self._is_underlined = False  # Track underline so unchanged states skip setFont
         self._label = ProvenanceLabel(text, state=state, dotted_path=dotted_path)
         layout.addWidget(self._label)
 
@@ -634,6 +635,10 @@ class LabelWithHelp(QWidget):
 
     def set_underline(self, underline: bool) -> None:
         """Set label underline based on whether value is concrete (not None/placeholder)."""
+        if underline == self._is_underlined:
+            return  # No change needed
+
+        self._is_underlined = underline
         font = self._label.font()
         font.setUnderline(underline)
         self._label.setFont(font)
@@ -24,3 +24,61 @@ def test_reorderable_list_widget(qapp):
     
     widget = ReorderableListWidget()
     assert widget is not None
+
+
+def test_debounce_timer_coalesces_triggers(qapp, qtbot):
+    """Test repeated triggers fire the handler once, and cancel suppresses it."""
+    from pyqt_formgen.core import DebounceTimer
+
+    called = []
+    timer = DebounceTimer(delay_ms=20, handler=lambda: called.append(1))
+
+    for _ in range(5):
+        timer.trigger()
+    qtbot.waitUntil(lambda: len(called) == 1, timeout=1000)
+    qtbot.wait(50)
+    assert called == [1]
+
+    timer.trigger()
+    timer.cancel()
+    qtbot.wait(50)
+    assert called == [1]
+
+    timer.force()
+    assert called == [1, 1]
+
+
+def test_natural_sort_orders_numbers_numerically():
+    """Test digit runs compare as integers, case-insensitively."""
+    from pyqt_formgen.core.sort_utils import natural_sort
+
+    assert natural_sort(["well10", "Well2", "well1"]) == ["well1", "Well2", "well10"]
+
+
+def test_path_cache_coalesces_saves_until_flush(tmp_path, monkeypatch):
+    """Test a burst of set_cached_path calls is written once, by the exit flush."""
+    import json
+    from pyqt_formgen.core import path_cache
+    from pyqt_formgen.core.path_cache import PathCacheKey, UnifiedPathCache
+
+    # Keep the debounce from elapsing so only the flush below can write
+    monkeypatch.setattr(path_cache, "_SAVE_DELAY_S", 60.0)
+    cache_file = tmp_path / "path_cache.json"
+    cache = UnifiedPathCache(cache_file)
+    writes = []
+    write_cache_file = cache._write_cache_file
+    monkeypatch.setattr(cache, "_write_cache_file", lambda data: (writes.append(data), write_cache_file(data)))
+
+    cache.set_cached_path(PathCacheKey.GENERAL, tmp_path)
+    cache.set_cached_path(PathCacheKey.PLATE_IMPORT, tmp_path)
+    cache.set_cached_path(PathCacheKey.GENERAL, tmp_path, verify=False)
+    assert writes == []
+    assert not cache_file.exists()
+
+    path_cache._flush_all_caches()
+    expected = {"general": str(tmp_path), "plate_import": str(tmp_path)}
+    assert writes == [expected]
+    assert json.loads(cache_file.read_text()) == expected
+
+    cache.flush()  # Nothing pending: no second write
+    assert len(writes) == 1